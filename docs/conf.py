@@ -1,5 +1,6 @@
 """Sphinx configuration for the MOUSE-TRAP documentation."""
 
+import importlib.util
 import os
 import sys
 from datetime import datetime
@@ -21,9 +22,7 @@ napoleon_attr_annotations = True
 templates_path = ["_templates"]
 exclude_patterns = []
 
-html_theme = "alabaster"
-try:
-
-    html_theme = "furo"
-except Exception:
-    pass
+# find_spec only consults the import finders; it does not execute furo's
+# package init (which drags in Pygments, beautifulsoup4, etc.) just to
+# check availability.
+html_theme = "furo" if importlib.util.find_spec("furo") is not None else "alabaster"
@@ -1,11 +1,8 @@
 """Qt dialog for video preview and frame-based enter/exit annotations."""
 
-import csv
-
-import cv2
 from PyQt6.QtCore import QEvent, QTimer, Qt, QUrl
-from PyQt6.QtGui import QImage, QPixmap
-from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtMultimedia import QAudioOutput, QMediaMetaData, QMediaPlayer
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 from PyQt6.QtWidgets import (
     QAbstractItemView,
@@ -28,6 +25,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 from typing import Union
+from fractions import Fraction
 from pathlib import Path
 
 
@@ -37,13 +35,16 @@ from pathlib import Path
 class VideoAnnotationDialog(QDialog):
     """Interactive dialog for frame-accurate (enter, exit) annotations.
 
-    Provides a video player (Qt Multimedia), a live OpenCV preview, and a table of
+    Provides a video player (Qt Multimedia), a live frame preview, and a table of
     intruders with editable *Enter*/*Exit* frames. Single-click seeks, double-click
     edits. Rows can be duplicated or deleted via a context menu.
     """
 
     def __init__(self, video_path: Union[str, Path], parent=None) -> None:
-        """Initialize widgets, read FPS/frame count, and show the first frame.
+        """Initialize widgets and show the first frame.
+
+        The frame rate and frame count are filled in from the player's
+        metadata once the media finishes loading.
 
         Args:
             video_path: Path to a video readable by Qt/OpenCV.
@@ -56,25 +57,37 @@ class VideoAnnotationDialog(QDialog):
         self.video_path = str(video_path)
         self.annotations = {}  # { intruderName: {"enter": frame, "exit": frame} }
 
-        cap = cv2.VideoCapture(self.video_path)
-        self.fps = cap.get(cv2.CAP_PROP_FPS)
-        if self.fps <= 0:
-            self.fps = 25
-        self.total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        cap.release()
-
-        self.cap_preview = cv2.VideoCapture(self.video_path)
+        # The real frame rate is adopted from the player's metadata once the
+        # media loads (_media_status_changed) — no separate OpenCV probe on
+        # open. 25 fps is only a pre-load placeholder.
+        self.total_frames = 0
+        self._set_fps(25.0)
+        self._last_frame_shown = None
+        self._preview_image = None
+        self._preview_scaled = None
+        self._preview_scaled_key = None
+        self._refine_timer = QTimer(self)
+        self._refine_timer.setSingleShot(True)
+        self._refine_timer.timeout.connect(self._refine_preview)
+        # positionChanged fires at frame rate during playback; coalescing
+        # refreshes to ~30 Hz drops redundant repaints the eye never sees.
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(33)
+        self._preview_timer.timeout.connect(self.update_preview)
         self.singleClickTimer = QTimer(self)
         self.singleClickTimer.setSingleShot(True)
         self.singleClickTimer.timeout.connect(self.perform_single_click)
         self.clicked_row = None
         self.clicked_column = None
+        # intruder -> table row, so single-row edits skip the full rebuild.
+        self._row_of = {}
 
         self.init_video_section()
         self.init_annotation_panel()
         self.setup_splitter()
         self.annotationTable.installEventFilter(self)
-        initial_position = int(1000 / self.fps)
+        initial_position = int(self._ms_per_frame)
         self.mediaPlayer.setPosition(initial_position)
 
     def init_video_section(self) -> None:
@@ -89,6 +102,9 @@ class VideoAnnotationDialog(QDialog):
         self.videoWidget = QVideoWidget(self)
         self.mediaPlayer.setVideoOutput(self.videoWidget)
         self.mediaPlayer.setSource(QUrl.fromLocalFile(self.video_path))
+        # The widget's own sink already holds each decoded frame; tapping its
+        # signal gives the preview the image for free.
+        self.videoWidget.videoSink().videoFrameChanged.connect(self._on_video_frame)
 
         self.previewLabel = QLabel(self)
         self.previewLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -103,6 +119,7 @@ class VideoAnnotationDialog(QDialog):
         self.positionSlider.sliderReleased.connect(self.slider_released)
         self.mediaPlayer.positionChanged.connect(self.position_changed)
         self.mediaPlayer.durationChanged.connect(self.duration_changed)
+        self.mediaPlayer.mediaStatusChanged.connect(self._media_status_changed)
 
         self.playButton = QPushButton("Play", self)
         self.playButton.clicked.connect(self.toggle_play)
@@ -180,6 +197,57 @@ class VideoAnnotationDialog(QDialog):
         mainLayout.addWidget(splitter)
         self.setLayout(mainLayout)
 
+    def _set_fps(self, fps: float) -> None:
+        """Set the frame rate and refresh every constant derived from it.
+
+        Frame math is reused across every slider tick: one ms-per-frame
+        constant instead of recomputing 1000/fps per event, plus rational fps
+        terms for the frame<->ms helpers — pure integer math, so repeated
+        snapping never drifts off frame boundaries the way accumulated float
+        rounding can.
+        """
+        self.fps = fps
+        self._ms_per_frame = 1000.0 / fps
+        _fps = Fraction(fps).limit_denominator(1000)
+        self._fps_num = _fps.numerator
+        self._fps_den = _fps.denominator
+
+    def _media_status_changed(self, status) -> None:
+        """Adopt the real frame rate and length once the media is loaded."""
+        if status != QMediaPlayer.MediaStatus.LoadedMedia:
+            return
+        rate = self.mediaPlayer.metaData().value(QMediaMetaData.Key.VideoFrameRate)
+        if rate:
+            self._set_fps(float(rate))
+            duration = self.mediaPlayer.duration()
+            if duration > 0:
+                self.total_frames = int(
+                    duration * self._fps_num // (1000 * self._fps_den)
+                )
+        else:
+            # Rarely, the backend reports no frame rate; fall back to a
+            # one-off OpenCV header probe (imported here so startup and the
+            # common path never load it).
+            import cv2
+
+            cap = cv2.VideoCapture(self.video_path)
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            if fps > 0:
+                self._set_fps(fps)
+            total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            cap.release()
+            if total > 0:
+                self.total_frames = total
+        self.positionSlider.setSingleStep(int(self._ms_per_frame))
+
+    def _ms_to_frame(self, ms: int) -> int:
+        """Convert a player position to a 1-indexed frame (integer math)."""
+        return int(ms * self._fps_num // (1000 * self._fps_den)) + 1
+
+    def _frame_to_ms(self, frame: int) -> int:
+        """Convert a 1-indexed frame to its starting millisecond."""
+        return int((frame - 1) * 1000 * self._fps_den // self._fps_num)
+
     def on_cell_clicked(self, row: int, column: int) -> None:
         """Start a single-click timer so single vs. double click can be disambiguated."""
         self.clicked_row = row
@@ -200,7 +268,7 @@ class VideoAnnotationDialog(QDialog):
             item = self.annotationTable.item(self.clicked_row, self.clicked_column)
             try:
                 frame = int(item.text())
-                frame_ms = int((frame - 1) * (1000 / self.fps))
+                frame_ms = self._frame_to_ms(frame)
                 self.mediaPlayer.setPosition(frame_ms)
             except ValueError:
                 pass
@@ -227,11 +295,11 @@ class VideoAnnotationDialog(QDialog):
                 "enter": original["enter"],
                 "exit": original["exit"],
             }
-            self.refresh_annotation_table()
+            self._upsert_row(new_intruder)
         elif action == delete_action:
             if intruder in self.annotations:
                 del self.annotations[intruder]
-                self.refresh_annotation_table()
+                self._remove_row(intruder)
 
     def eventFilter(self, source, event) -> bool:
         """Handle the Delete key to remove selected intruder rows."""
@@ -240,11 +308,14 @@ class VideoAnnotationDialog(QDialog):
                 selected_rows = {
                     item.row() for item in self.annotationTable.selectedItems()
                 }
-                for row in sorted(selected_rows, reverse=True):
-                    intruder = self.annotationTable.item(row, 0).text()
+                names = [
+                    self.annotationTable.item(row, 0).text()
+                    for row in sorted(selected_rows, reverse=True)
+                ]
+                for intruder in names:
                     if intruder in self.annotations:
                         del self.annotations[intruder]
-                self.refresh_annotation_table()
+                        self._remove_row(intruder)
                 return True
         return super().eventFilter(source, event)
 
@@ -259,40 +330,47 @@ class VideoAnnotationDialog(QDialog):
         )
         if not fileName:
             return
-        mapping = {}
+        import pandas as pd
+
         try:
-            with open(fileName, newline="", encoding="utf-8-sig") as csvfile:
-                reader = csv.DictReader(csvfile)
-                headers = reader.fieldnames
-                if headers is None or "file_name" not in [h.strip() for h in headers]:
-                    QMessageBox.critical(
-                        self,
-                        "CSV Error",
-                        f"CSV must include a 'file_name' column. Found headers: {headers}",
+            # pandas parses the file and coerces numbers in vectorized C;
+            # Python only walks the populated cells afterwards.
+            df = pd.read_csv(fileName, encoding="utf-8-sig")
+            df.columns = [str(c).strip() for c in df.columns]
+            if "file_name" not in df.columns:
+                QMessageBox.critical(
+                    self,
+                    "CSV Error",
+                    "CSV must include a 'file_name' column. "
+                    f"Found headers: {list(df.columns)}",
+                )
+                return
+            columns = []
+            for header in df.columns:
+                if header.endswith("_in"):
+                    columns.append((header, header[:-3], "enter"))
+                elif header.endswith("_out"):
+                    columns.append((header, header[:-4], "exit"))
+            # fillna first: astype(str) would turn empty cells (NaN) into the
+            # literal "nan" and create a bogus mapping key for blank rows.
+            fnames = df["file_name"].fillna("").astype(str).str.strip()
+            mapping = {fname: {} for fname in fnames if fname}
+            for header, intruder, field in columns:
+                raw = df[header]
+                values = pd.to_numeric(raw, errors="coerce")
+                # Coercion must not silently drop data: a non-empty cell that
+                # became NaN, or a fractional frame number, is a corrupt file
+                # and raises into the error dialog like the csv parser did.
+                filled = raw.notna() & (raw.astype(str).str.strip() != "")
+                bad = raw[filled & (values.isna() | (values % 1 != 0))]
+                if not bad.empty:
+                    raise ValueError(
+                        f"Invalid frame value(s) in column '{header}': "
+                        + ", ".join(bad.astype(str).unique()[:5])
                     )
-                    return
-                for row in reader:
-                    fname = row.get("file_name", "").strip()
-                    if not fname:
-                        continue
-                    annotations = {}
-                    for key, value in row.items():
-                        key_clean = key.strip()
-                        if key_clean == "file_name":
-                            continue
-                        if value.strip() == "":
-                            continue
-                        if key_clean.endswith("_in"):
-                            intruder = key_clean[:-3]
-                            if intruder not in annotations:
-                                annotations[intruder] = {}
-                            annotations[intruder]["enter"] = int(value)
-                        elif key_clean.endswith("_out"):
-                            intruder = key_clean[:-4]
-                            if intruder not in annotations:
-                                annotations[intruder] = {}
-                            annotations[intruder]["exit"] = int(value)
-                    mapping[fname] = annotations
+                for fname, value in zip(fnames, values):
+                    if fname and pd.notna(value):
+                        mapping[fname].setdefault(intruder, {})[field] = int(value)
         except Exception as e:
             QMessageBox.critical(self, "CSV Error", f"Error reading CSV: {str(e)}")
             return
@@ -307,9 +385,15 @@ class VideoAnnotationDialog(QDialog):
         self.refresh_annotation_table()
 
     def refresh_annotation_table(self) -> None:
-        """Repopulate the table from :attr:`annotations` without emitting signals."""
+        """Repopulate the table from :attr:`annotations` without emitting signals.
+
+        Used for bulk changes (imports, clear); single-row edits go through
+        :meth:`_upsert_row` / :meth:`_remove_row` instead.
+        """
         self.annotationTable.blockSignals(True)
+        self.annotationTable.setUpdatesEnabled(False)
         self.annotationTable.setRowCount(0)
+        self._row_of = {}
         for i, (intruder, data) in enumerate(self.annotations.items()):
             self.annotationTable.insertRow(i)
             intruder_item = QTableWidgetItem(intruder)
@@ -319,8 +403,39 @@ class VideoAnnotationDialog(QDialog):
             self.annotationTable.setItem(i, 1, enter_item)
             exit_item = QTableWidgetItem(str(data.get("exit", "")))
             self.annotationTable.setItem(i, 2, exit_item)
+            self._row_of[intruder] = i
+        self.annotationTable.setUpdatesEnabled(True)
         self.annotationTable.blockSignals(False)
 
+    def _upsert_row(self, intruder: str) -> None:
+        """Insert or refresh only ``intruder``'s row."""
+        data = self.annotations[intruder]
+        table = self.annotationTable
+        table.blockSignals(True)
+        row = self._row_of.get(intruder)
+        if row is None:
+            row = table.rowCount()
+            table.insertRow(row)
+            intruder_item = QTableWidgetItem(intruder)
+            intruder_item.setFlags(intruder_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            table.setItem(row, 0, intruder_item)
+            self._row_of[intruder] = row
+        table.setItem(row, 1, QTableWidgetItem(str(data.get("enter", ""))))
+        table.setItem(row, 2, QTableWidgetItem(str(data.get("exit", ""))))
+        table.blockSignals(False)
+
+    def _remove_row(self, intruder: str) -> None:
+        """Remove only ``intruder``'s row and shift the cached indices."""
+        row = self._row_of.pop(intruder, None)
+        if row is None:
+            return
+        self.annotationTable.blockSignals(True)
+        self.annotationTable.removeRow(row)
+        self.annotationTable.blockSignals(False)
+        for name, r in self._row_of.items():
+            if r > row:
+                self._row_of[name] = r - 1
+
     def table_item_changed(self, item) -> None:
         """Persist manual edits in the table back to :attr:`annotations`."""
         row = item.row()
@@ -346,15 +461,23 @@ class VideoAnnotationDialog(QDialog):
 
     def position_changed(self, position: int) -> None:
         """Update the slider, frame label (1-indexed), and preview when playback moves."""
-        self.positionSlider.setValue(position)
-        frame = min(int(position / 1000.0 * self.fps) + 1, self.total_frames)
-        self.frameLabel.setText(f"Frame: {frame if frame > 0 else 1}")
-        self.update_preview()
+        # Don't fight the user mid-drag, and don't re-emit valueChanged for a
+        # programmatic update — both cost a style repolish per tick.
+        if not self.positionSlider.isSliderDown():
+            self.positionSlider.blockSignals(True)
+            self.positionSlider.setValue(position)
+            self.positionSlider.blockSignals(False)
+        frame = min(self._ms_to_frame(position), self.total_frames)
+        if frame != self._last_frame_shown:
+            self._last_frame_shown = frame
+            self.frameLabel.setText(f"Frame: {frame if frame > 0 else 1}")
+        if not self._preview_timer.isActive():
+            self._preview_timer.start()
 
     def duration_changed(self, duration: int) -> None:
         """Set slider range and step once the media duration is known."""
         self.positionSlider.setRange(0, duration)
-        self.positionSlider.setSingleStep(int(1000 / self.fps))
+        self.positionSlider.setSingleStep(int(self._ms_per_frame))
 
     def set_position(self, position: int) -> None:
         """Seek to an absolute position in milliseconds."""
@@ -363,34 +486,62 @@ class VideoAnnotationDialog(QDialog):
     def slider_released(self) -> None:
         """Snap to exact frame boundaries when the slider is released."""
         pos = self.positionSlider.value()
-        frame_ms = int(1000 / self.fps)
-        rounded = round(pos / frame_ms) * frame_ms
-        self.mediaPlayer.setPosition(rounded)
+        # Nearest frame index, then its exact boundary — all in integers.
+        nearest = (2 * pos * self._fps_num + 1000 * self._fps_den) // (
+            2000 * self._fps_den
+        )
+        self.mediaPlayer.setPosition(self._frame_to_ms(nearest + 1))
         QTimer.singleShot(150, self.update_preview)
 
+    def _on_video_frame(self, frame) -> None:
+        """Mirror the player's decoded frame into the preview label.
+
+        Fast scaling keeps scrubbing fluid; the single-shot timer repaints
+        once with smooth filtering after the position stops changing.
+        """
+        if not frame.isValid():
+            return
+        self._preview_image = frame.toImage()
+        self._set_preview_pixmap(Qt.TransformationMode.FastTransformation)
+        self._refine_timer.start(150)
+
     def update_preview(self) -> None:
-        """Grab the nearest frame via OpenCV and render a scaled preview image."""
-        position = self.mediaPlayer.position()
-        self.cap_preview.set(cv2.CAP_PROP_POS_MSEC, position)
-        ret, frame = self.cap_preview.read()
-        if ret:
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            height, width, channel = frame_rgb.shape
-            bytes_per_line = channel * width
-            qimg = QImage(
-                frame_rgb.data,
-                width,
-                height,
-                bytes_per_line,
-                QImage.Format.Format_RGB888,
-            )
-            pixmap = QPixmap.fromImage(qimg).scaled(
-                self.previewLabel.width(),
-                self.previewLabel.height(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            self.previewLabel.setPixmap(pixmap)
+        """Re-render the most recent sink frame (e.g., after a resize)."""
+        if self._preview_image is not None and not self._preview_image.isNull():
+            self._set_preview_pixmap(Qt.TransformationMode.FastTransformation)
+            self._refine_timer.start(150)
+
+    def _set_preview_pixmap(self, mode) -> None:
+        """Scale the current preview image to the label with ``mode``.
+
+        The scaled pixmap is cached keyed on the source image, the label
+        size and the transformation mode, so repeat paints of the same
+        frame (e.g. the smooth refine after a fast pass at rest) skip the
+        rescale entirely. A resize changes the key and invalidates it.
+        """
+        key = (
+            self._preview_image.cacheKey(),
+            self.previewLabel.width(),
+            self.previewLabel.height(),
+            mode,
+        )
+        if key == self._preview_scaled_key:
+            self.previewLabel.setPixmap(self._preview_scaled)
+            return
+        pixmap = QPixmap.fromImage(self._preview_image).scaled(
+            self.previewLabel.width(),
+            self.previewLabel.height(),
+            Qt.AspectRatioMode.KeepAspectRatio,
+            mode,
+        )
+        self._preview_scaled_key = key
+        self._preview_scaled = pixmap
+        self.previewLabel.setPixmap(pixmap)
+
+    def _refine_preview(self) -> None:
+        """Re-render the last frame with smooth filtering once scrubbing rests."""
+        if self._preview_image is not None:
+            self._set_preview_pixmap(Qt.TransformationMode.SmoothTransformation)
 
     def resizeEvent(self, event) -> None:
         """Keep the preview in sync with the widget size."""
@@ -408,7 +559,7 @@ class VideoAnnotationDialog(QDialog):
             step = int(self.scrubStepCombo.currentText())
         except ValueError:
             step = 1
-        frame_ms = int(1000 / self.fps)
+        frame_ms = int(self._ms_per_frame)
         increment = step * frame_ms
         if event.key() == Qt.Key.Key_Left:
             newPos = max(0, self.mediaPlayer.position() - increment)
@@ -425,7 +576,7 @@ class VideoAnnotationDialog(QDialog):
         Warns if an enter frame already exists for that intruder.
         """
         current_position = self.mediaPlayer.position()
-        frame = min(int(current_position / 1000.0 * self.fps) + 1, self.total_frames)
+        frame = min(self._ms_to_frame(current_position), self.total_frames)
         intruder_name, ok = QInputDialog.getText(
             self, "Intruder Name", "Enter intruder name for entry:"
         )
@@ -446,7 +597,7 @@ class VideoAnnotationDialog(QDialog):
                     "Annotation",
                     f"Marked enter for {intruder_name} at frame {frame}.",
                 )
-                self.refresh_annotation_table()
+                self._upsert_row(intruder_name)
 
     def mark_exit(self) -> None:
         """Record Exit for an intruder (select an existing one or type a new one).
@@ -454,7 +605,7 @@ class VideoAnnotationDialog(QDialog):
         Warns if an exit frame already exists for that intruder.
         """
         current_position = self.mediaPlayer.position()
-        frame = min(int(current_position / 1000.0 * self.fps) + 1, self.total_frames)
+        frame = min(self._ms_to_frame(current_position), self.total_frames)
         available = [
             name
             for name, data in self.annotations.items()
@@ -490,12 +641,10 @@ class VideoAnnotationDialog(QDialog):
                     "Annotation",
                     f"Marked exit for {intruder_name} at frame {frame}.",
                 )
-                self.refresh_annotation_table()
+                self._upsert_row(intruder_name)
 
     def closeEvent(self, event) -> None:
-        """Release OpenCV resources before the dialog closes."""
-        if self.cap_preview.isOpened():
-            self.cap_preview.release()
+        """Accept the close; the only decoder is the player's own."""
         event.accept()
 
     def toggle_full_screen(self) -> None:
@@ -1,22 +1,323 @@
 """Conversion helpers and worker thread for videos, images, PDFs, DOCX, and TXT."""
 
+import atexit
+import base64
+import importlib
+import json
+import os
+import queue
+import shutil
 import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-import cv2
-import pypandoc
-from docx2pdf import convert as docx2pdf_convert
-from pdf2image import convert_from_path
-from PIL import Image
-from PyQt6.QtCore import QProcess, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QProcess, QRunnable, QThread, pyqtSignal
 from typing import Optional, Tuple, Union
 
 
+# Heavy native-backed modules (OpenCV, Pillow, pdf2image, pypandoc, docx2pdf)
+# are imported on first use so application startup does not pay for conversion
+# paths the user never exercises.
+_LAZY_IMPORTS = {
+    "cv2": ("cv2", None),
+    "np": ("numpy", None),
+    "Image": ("PIL.Image", None),
+    "convert_from_path": ("pdf2image", "convert_from_path"),
+    "pypandoc": ("pypandoc", None),
+    "docx2pdf_convert": ("docx2pdf", "convert"),
+}
+
+
+def _lazy_import(name: str):
+    """Import and cache one of the heavy conversion backends by local name.
+
+    After the first import the object is stored in this module's globals, so
+    subsequent calls cost only a dict lookup.
+    """
+    try:
+        return globals()[name]
+    except KeyError:
+        pass
+    module_name, attr = _LAZY_IMPORTS[name]
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str):
+    """Resolve lazily imported conversion backends on attribute access."""
+    if name in _LAZY_IMPORTS:
+        return _lazy_import(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Hardware H.264 encoders in preference order; probed once per process.
+_HW_H264_ENCODERS = ("h264_nvenc", "h264_videotoolbox", "h264_qsv", "h264_vaapi")
+_hw_encoder: Optional[str] = None
+_hw_encoder_probed = False
+
+
+def _detect_hw_encoder() -> Optional[str]:
+    """Return the best available hardware H.264 encoder name, or ``None``.
+
+    Runs ``ffmpeg -hide_banner -encoders`` on first call and caches the result
+    for the process lifetime, so repeated conversions pay no probe cost.
+    """
+    global _hw_encoder, _hw_encoder_probed
+    if not _hw_encoder_probed:
+        _hw_encoder_probed = True
+        try:
+            res = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-encoders"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+            listing = res.stdout.decode("utf-8", errors="ignore")
+            for name in _HW_H264_ENCODERS:
+                if name in listing:
+                    _hw_encoder = name
+                    break
+        except OSError:
+            _hw_encoder = None
+    return _hw_encoder
+
+
+# Known raster extensions -> Pillow format names, used to skip Pillow's
+# format-guessing probe loop when opening images.
+_PIL_FORMAT_BY_EXT = {
+    ".jpg": "JPEG",
+    ".jpeg": "JPEG",
+    ".png": "PNG",
+    ".tiff": "TIFF",
+    ".bmp": "BMP",
+}
+
+# Source modes each output format can store directly. Converting to RGB is
+# only worthwhile when the target can't take the mode as-is; a blanket
+# convert("RGB") costs a full-image copy and drops alpha on PNG->PNG.
+_MODE_OK = {
+    "JPEG": {"RGB", "L"},
+    "PDF": {"RGB", "L", "CMYK"},
+    "BMP": {"RGB", "RGBA", "L", "P"},
+    "PNG": {"RGB", "RGBA", "L", "P", "LA"},
+    "TIFF": {"RGB", "RGBA", "L", "P", "CMYK"},
+}
+
+_pandoc_path_cached = False
+
+
+_turbojpeg = None
+_turbojpeg_failed = False
+
+
+def _get_turbojpeg():
+    """Return a cached PyTurboJPEG encoder, or ``None`` when unavailable.
+
+    libjpeg-turbo encodes with SIMD kernels, several times faster than the
+    reference libjpeg that stock Pillow links. Optional; probed once.
+    """
+    global _turbojpeg, _turbojpeg_failed
+    if _turbojpeg is None and not _turbojpeg_failed:
+        try:
+            from turbojpeg import TurboJPEG
+
+            _turbojpeg = TurboJPEG()
+        except Exception:
+            _turbojpeg_failed = True
+    return _turbojpeg
+
+
+def _ensure_pandoc_path() -> None:
+    """Pin the pandoc binary path once so pypandoc skips per-call detection.
+
+    Unless ``PYPANDOC_PANDOC`` points at a concrete binary, pypandoc re-walks
+    ``PATH`` and shells out to ``pandoc --version`` on every conversion; in a
+    batch GUI those probes add up.
+    """
+    global _pandoc_path_cached
+    if _pandoc_path_cached:
+        return
+    _pandoc_path_cached = True
+    pypandoc = _lazy_import("pypandoc")
+    try:
+        os.environ.setdefault("PYPANDOC_PANDOC", pypandoc.get_pandoc_path())
+    except OSError:
+        pass
+
+
+# Shared ``pandoc server`` process (pandoc >= 2.18). Spawned on first use so
+# batch text conversions pay pandoc's cold start once, not per file.
+_pandoc_server_proc: Optional[subprocess.Popen] = None
+_pandoc_server_failed = False
+_pandoc_server_session = None
+_pandoc_server_lock = threading.Lock()
+_PANDOC_SERVER_URL = "http://127.0.0.1:3030"
+
+# Formats the server exchanges base64-encoded instead of as plain text.
+_PANDOC_BINARY_FMTS = {"docx", "odt", "epub", "pptx"}
+
+
+def _pandoc_server_convert(
+    src: Union[Path, str], dst: Union[Path, str], from_fmt: str, to_fmt: str
+) -> bool:
+    """Convert ``src`` to ``dst`` through a shared ``pandoc server`` process.
+
+    Each ``pypandoc.convert_file`` call forks a fresh pandoc (~200-500 ms of
+    cold start); the HTTP server mode keeps one process alive for the whole
+    batch. Returns ``False`` on any problem — missing pandoc/requests, old
+    pandoc without server mode, HTTP errors — so callers can fall back to
+    ``pypandoc``. PDF output is not routed here; the server cannot drive an
+    external PDF engine.
+    """
+    global _pandoc_server_proc, _pandoc_server_failed, _pandoc_server_session
+    if _pandoc_server_failed or to_fmt == "pdf":
+        return False
+    try:
+        import requests
+    except ImportError:
+        _pandoc_server_failed = True
+        return False
+    with _pandoc_server_lock:
+        if _pandoc_server_session is None:
+            # One Session keeps the TCP connection alive across the batch
+            # instead of a fresh handshake per document.
+            _pandoc_server_session = requests.Session()
+        if _pandoc_server_proc is None or _pandoc_server_proc.poll() is not None:
+            pandoc = os.environ.get("PYPANDOC_PANDOC") or shutil.which("pandoc")
+            if not pandoc:
+                _pandoc_server_failed = True
+                return False
+            try:
+                _pandoc_server_proc = subprocess.Popen(
+                    [pandoc, "server", "--port", "3030"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+                # Tear the server down with the process; terminate() on an
+                # already-dead child is harmless, so registering per spawn
+                # is fine.
+                atexit.register(_pandoc_server_proc.terminate)
+            except OSError:
+                _pandoc_server_failed = True
+                return False
+        try:
+            if from_fmt in _PANDOC_BINARY_FMTS:
+                text = base64.b64encode(Path(src).read_bytes()).decode("ascii")
+            else:
+                text = Path(src).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return False
+        payload = {"text": text, "from": from_fmt, "to": to_fmt}
+        resp = None
+        for _ in range(20):
+            try:
+                resp = _pandoc_server_session.post(
+                    _PANDOC_SERVER_URL, json=payload, timeout=10
+                )
+                break
+            except requests.ConnectionError:
+                # Server still starting up.
+                time.sleep(0.05)
+            except requests.RequestException:
+                return False
+        if resp is None:
+            _pandoc_server_failed = True
+            return False
+        if resp.status_code != 200:
+            return False
+        try:
+            output = resp.json().get("output", "")
+            if to_fmt in _PANDOC_BINARY_FMTS:
+                Path(dst).write_bytes(base64.b64decode(output))
+            else:
+                Path(dst).write_text(output, encoding="utf-8")
+        except (OSError, ValueError):
+            return False
+        return True
+
+
+@lru_cache(maxsize=1024)
+def _probe_media(path: str, mtime: float) -> Optional[dict]:
+    """Return ffprobe stream/format metadata for ``path``, or ``None``.
+
+    Each ffprobe fork costs 100-200 ms; progress normalization, remux checks
+    and clip cutting may all want metadata for the same file, so results are
+    cached. ``mtime`` is part of the key only to invalidate entries when the
+    file changes on disk.
+    """
+    try:
+        out = subprocess.check_output(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-show_streams",
+                "-show_format",
+                "-of",
+                "json",
+                path,
+            ],
+            stderr=subprocess.DEVNULL,
+        )
+        return json.loads(out)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+
+
+def _probe_duration_us(path: Union[Path, str]) -> Optional[int]:
+    """Return a media file's duration in microseconds, or ``None``.
+
+    The unit matches FFmpeg's ``-progress`` key ``out_time_ms``, which
+    (despite its name) reports microseconds. Backed by the cached
+    :func:`_probe_media` metadata.
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    meta = _probe_media(os.fspath(path), mtime)
+    if not meta:
+        return None
+    try:
+        return int(float(meta["format"]["duration"]) * 1_000_000)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _h264_encode_args(encoder: Optional[str]) -> list:
+    """Return encoder arguments for MP4 output given a probed hardware encoder.
+
+    Falls back to the SLEAP-recommended libx264 settings when no hardware
+    encoder is available.
+    """
+    if encoder:
+        preset = "p4" if encoder == "h264_nvenc" else "fast"
+        return ["-c:v", encoder, "-preset", preset, "-pix_fmt", "yuv420p"]
+    return [
+        "-c:v",
+        "libx264",
+        "-pix_fmt",
+        "yuv420p",
+        "-preset",
+        "superfast",
+        "-crf",
+        "23",
+    ]
+
+
 # -----------------------------------------------------------------------------
 # Helper Function for Video Conversion (seq or mp4 to AVI)
 # -----------------------------------------------------------------------------
 def video_to_avi(
-    input_path: Union[Path, str], avi_path: Union[Path, str]
+    input_path: Union[Path, str],
+    avi_path: Union[Path, str],
+    progress_cb=None,
 ) -> Tuple[bool, str]:
     """Convert a video stream or image sequence to an MJPEG ``.avi`` using FFmpeg.
 
@@ -26,6 +327,8 @@ def video_to_avi(
     Args:
         input_path: Path to the source video/sequence (e.g., ``.mp4``, ``.seq``).
         avi_path: Destination ``.avi`` path to create.
+        progress_cb: Optional callable receiving an integer percentage; when
+            given, FFmpeg's ``-progress`` stream is parsed during the run.
 
     Returns:
         Tuple[bool, str]: A pair ``(success, message)``. On failure, the message
@@ -53,6 +356,29 @@ def video_to_avi(
         str(avi_path),
     ]
     process = QProcess()
+    if progress_cb is not None:
+        duration_us = _probe_duration_us(input_path)
+        if duration_us:
+            # -progress lines arrive on stdout while waitForFinished spins
+            # the process's event delivery, so the caller sees live percent.
+            cmd[-2:-2] = ["-progress", "pipe:1", "-nostats"]
+            last_pct = -1
+
+            def _on_stdout():
+                nonlocal last_pct
+                data = process.readAllStandardOutput().data().decode(errors="ignore")
+                for line in data.splitlines():
+                    if line.startswith("out_time_ms="):
+                        try:
+                            elapsed_us = int(line.split("=", 1)[1])
+                        except ValueError:
+                            continue
+                        pct = min(100, int(elapsed_us * 100 // duration_us))
+                        if pct != last_pct:
+                            last_pct = pct
+                            progress_cb(pct)
+
+            process.readyReadStandardOutput.connect(_on_stdout)
     process.start(cmd[0], cmd[1:])
     process.waitForFinished(-1)
     if process.exitCode() != 0:
@@ -82,7 +408,11 @@ class ConversionThread(QThread):
         input_file: Source file path.
         output_file: Destination file path.
         conversion_type: One of the supported conversion keys (e.g., ``"pdf_to_image"``).
-        total_duration_ms: Optional total duration used to compute FFmpeg progress.
+        total_duration_ms: Optional total duration used to compute FFmpeg
+            progress, in the same unit as FFmpeg's ``out_time_ms`` progress
+            key (microseconds). Probed via ffprobe when left unset.
+        cached_image: Optional already-decoded ``PIL.Image`` for the input
+            file, letting image conversions skip the open/decode step.
 
     """
 
@@ -92,19 +422,47 @@ class ConversionThread(QThread):
     #: Emitted when conversion finishes. Arguments: (success, message).
     finished_signal = pyqtSignal(bool, str)
 
+    #: Conversion key -> method name, resolved once in :meth:`run` instead of
+    #: walking an if/elif ladder per file. ``seq_to_avi``/``video_to_avi``
+    #: are handled separately because they call the module-level AVI writer.
+    _HANDLERS = {
+        "seq_to_mp4": "seq_to_mp4",
+        "video_to_video": "ffmpeg_video_convert",
+        "image_to_image": "image_to_image",
+        "image_to_pdf": "image_to_pdf",
+        "pdf_to_image": "pdf_to_image",
+        "pdf_to_docx": "pdf_to_docx",
+        "pdf_to_txt": "pdf_to_txt",
+        "docx_to_pdf": "docx_to_pdf",
+        "docx_to_txt": "docx_to_txt",
+        "txt_to_pdf": "txt_to_pdf",
+        "txt_to_docx": "txt_to_docx",
+    }
+
     def __init__(
         self,
         input_file: Union[Path, str],
         output_file: Union[Path, str],
         conversion_type: str,
         parent: Optional[object] = None,
+        cached_image=None,
     ) -> None:
         """Store input/output paths and selected conversion type."""
         super().__init__(parent)
         self.input_file = Path(input_file)
         self.output_file = Path(output_file)
+        # Plain-string forms and extensions, computed once; the conversion
+        # methods hand these to subprocesses and libraries repeatedly.
+        self._in = os.fspath(self.input_file)
+        self._out = os.fspath(self.output_file)
+        self._in_ext = self.input_file.suffix.lower()
+        self._out_ext = self.output_file.suffix.lower()
         self.conversion_type = conversion_type
         self.total_duration_ms = None  # Only used for ffmpeg conversions if needed
+        self.cached_image = cached_image
+        # Last percentage emitted by handle_ffmpeg_output; progress is only
+        # re-emitted when the integer percent actually changes.
+        self._last_pct = -1
 
     def run(self) -> None:
         """Dispatch to the selected conversion routine and emit the result.
@@ -114,112 +472,291 @@ class ConversionThread(QThread):
         of crashing the application.
         """
         try:
-            success, msg = False, "Unknown conversion"
-            if self.conversion_type == "seq_to_mp4":
-                success, msg = self.seq_to_mp4()
-            elif self.conversion_type == "seq_to_avi":
-                success, msg = video_to_avi(self.input_file, self.output_file)
-            elif self.conversion_type == "video_to_avi":
-                success, msg = video_to_avi(self.input_file, self.output_file)
-            elif self.conversion_type == "video_to_video":
-                success, msg = self.ffmpeg_video_convert()
-            elif self.conversion_type == "image_to_image":
-                success, msg = self.image_to_image()
-            elif self.conversion_type == "image_to_pdf":
-                success, msg = self.image_to_pdf()
-            elif self.conversion_type == "pdf_to_image":
-                success, msg = self.pdf_to_image()
-            elif self.conversion_type == "pdf_to_docx":
-                success, msg = self.pdf_to_docx()
-            elif self.conversion_type == "pdf_to_txt":
-                success, msg = self.pdf_to_txt()
-            elif self.conversion_type == "docx_to_pdf":
-                success, msg = self.docx_to_pdf()
-            elif self.conversion_type == "docx_to_txt":
-                success, msg = self.docx_to_txt()
-            elif self.conversion_type == "txt_to_pdf":
-                success, msg = self.txt_to_pdf()
-            elif self.conversion_type == "txt_to_docx":
-                success, msg = self.txt_to_docx()
+            # A same-extension video/image "conversion" is just a byte copy;
+            # skip the decode/re-encode entirely.
+            if (
+                self._in_ext == self._out_ext
+                and self._in != self._out
+                and self.conversion_type in ("video_to_video", "image_to_image")
+            ):
+                shutil.copy2(self._in, self._out)
+                self.finished_signal.emit(
+                    True, f"Copied {self.input_file} to {self.output_file}."
+                )
+                return
+            if self.conversion_type in ("seq_to_avi", "video_to_avi"):
+                success, msg = video_to_avi(
+                    self.input_file,
+                    self.output_file,
+                    progress_cb=self.progress_signal.emit,
+                )
             else:
-                success, msg = self.generic_conversion()
+                handler = getattr(
+                    self,
+                    self._HANDLERS.get(self.conversion_type, "generic_conversion"),
+                )
+                success, msg = handler()
             self.finished_signal.emit(success, msg)
         except Exception as e:
             self.finished_signal.emit(False, str(e))
 
+    def _run_ffmpeg(self, cmd: list, duration_us: Optional[int]) -> Tuple[int, str]:
+        """Run an FFmpeg command and stream its ``-progress`` output.
+
+        Expects ``-progress pipe:1 -nostats`` in ``cmd``. ``out_time_ms``
+        lines (microseconds, despite the name) are normalized against
+        ``duration_us`` and emitted on :attr:`progress_signal` at one-percent
+        granularity. The 1 MiB pipe buffer cuts per-line syscall overhead on
+        long encodes. stderr is drained concurrently into a bounded deque, so
+        a chatty encode neither stalls on a full pipe nor accumulates
+        megabytes of log text; only the last lines survive for the error
+        message.
+
+        Returns:
+            Tuple[int, str]: FFmpeg's exit code and the tail of its stderr.
+
+        """
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=1 << 20,
+            text=True,
+        )
+        stderr_tail: deque = deque(maxlen=200)
+
+        def _drain_stderr() -> None:
+            for line in proc.stderr:
+                stderr_tail.append(line)
+
+        reader = threading.Thread(target=_drain_stderr, daemon=True)
+        reader.start()
+        last_pct = -1
+        if proc.stdout:
+            for line in proc.stdout:
+                if duration_us and line.startswith("out_time_ms="):
+                    try:
+                        out_time_us = int(line.split("=", 1)[1])
+                    except ValueError:
+                        continue
+                    pct = min(100, (out_time_us * 100) // duration_us)
+                    if pct != last_pct:
+                        self.progress_signal.emit(pct)
+                        last_pct = pct
+        proc.wait()
+        reader.join()
+        return proc.returncode, "".join(stderr_tail)
+
+    def _remux_seq_to_mp4(self) -> bool:
+        """Attempt a lossless stream-copy rewrite of the input into MP4.
+
+        When FFmpeg can read the ``.seq`` container directly, ``-c copy``
+        rewrites packets without decoding or re-encoding a single frame —
+        an order of magnitude faster than any transcode. Progress is parsed
+        from the ``-progress`` stream. Returns ``True`` only when FFmpeg
+        exits cleanly; callers fall back to transcoding otherwise.
+        """
+        duration_us = _probe_duration_us(self.input_file)
+        cmd = [
+            "ffmpeg",
+            "-loglevel",
+            "error",
+            "-i",
+            self._in,
+            "-c",
+            "copy",
+            "-movflags",
+            "+faststart",
+            "-progress",
+            "pipe:1",
+            "-nostats",
+            "-y",
+            self._out,
+        ]
+        try:
+            returncode, _ = self._run_ffmpeg(cmd, duration_us)
+        except OSError:
+            return False
+        return returncode == 0
+
+    def _transcode_seq_hw(self, encoder: str) -> bool:
+        """Attempt a direct FFmpeg transcode using a hardware H.264 encoder.
+
+        When FFmpeg can read the container itself, ``-hwaccel auto`` plus the
+        probed encoder offloads both decode and encode to the GPU, leaving
+        the CPU free for other batch work. Returns ``True`` only when FFmpeg
+        exits cleanly; callers fall back to the OpenCV path otherwise.
+        """
+        duration_us = _probe_duration_us(self.input_file)
+        cmd = [
+            "ffmpeg",
+            "-loglevel",
+            "error",
+            "-hwaccel",
+            "auto",
+            "-i",
+            self._in,
+        ]
+        cmd.extend(_h264_encode_args(encoder))
+        cmd.extend(["-progress", "pipe:1", "-nostats", "-y", self._out])
+        try:
+            returncode, _ = self._run_ffmpeg(cmd, duration_us)
+        except OSError:
+            return False
+        return returncode == 0
+
     def seq_to_mp4(self) -> Tuple[bool, str]:
-        """Transcode a ``.seq`` stream to ``.mp4`` using OpenCV.
+        """Convert a ``.seq`` stream to ``.mp4``, remuxing when possible.
 
-        Emits :attr:`progress_signal` proportional to the number of frames written.
+        A lossless stream copy is attempted first (see
+        :meth:`_remux_seq_to_mp4`), then a GPU transcode when a hardware
+        encoder was probed (see :meth:`_transcode_seq_hw`). If both fail,
+        frames are decoded with OpenCV and piped as raw BGR bytes
+        into a single FFmpeg process, so the encode loop runs in native code
+        instead of per-frame ``VideoWriter.write`` calls from Python.
+        Progress is emitted at roughly one-percent intervals to avoid
+        flooding the GUI thread.
 
         Returns:
             Tuple[bool, str]: ``(True, message)`` on success; otherwise ``(False, message)``.
 
         """
-        cap = cv2.VideoCapture(str(self.input_file))
+        if self._remux_seq_to_mp4():
+            return True, f"Converted .seq to .mp4 (stream copy): {self.output_file}"
+        encoder = _detect_hw_encoder()
+        if encoder and self._transcode_seq_hw(encoder):
+            return True, f"Converted .seq to .mp4 ({encoder}): {self.output_file}"
+        cv2 = _lazy_import("cv2")
+        # Let OpenCV's decode pipeline use every core, and buffer a few
+        # frames ahead so the reader isn't stalled by single-frame fetches.
+        cv2.setNumThreads(max(1, os.cpu_count() or 1))
+        cap = cv2.VideoCapture(self._in)
         if not cap.isOpened():
             return False, f"Could not open {self.input_file} as .seq."
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 8)
         fps = cap.get(cv2.CAP_PROP_FPS)
         if fps <= 0:
             fps = 25
         width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-        out = cv2.VideoWriter(str(self.output_file), fourcc, fps, (width, height))
-        frame_count = 0
         total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) or 0
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            out.write(frame)
-            frame_count += 1
-            if total_frames > 0:
-                progress_percent = int((frame_count / total_frames) * 100)
-                self.progress_signal.emit(progress_percent)
-        cap.release()
-        out.release()
+        cmd = [
+            "ffmpeg",
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "bgr24",
+            "-s",
+            f"{width}x{height}",
+            "-r",
+            str(fps),
+            "-i",
+            "-",
+        ]
+        cmd.extend(_h264_encode_args(encoder))
+        cmd.extend(["-y", self._out])
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        np = _lazy_import("np")
+        # Decode and pipe-feed overlap on two threads: the producer only
+        # calls cap.read, the consumer only writes to FFmpeg's stdin. A small
+        # ring of preallocated buffers cycles between a free queue and the
+        # frame queue, so no per-frame allocation or copy happens anywhere —
+        # cap.read decodes in place and stdin.write consumes the buffer
+        # directly via the buffer protocol.
+        free: "queue.Queue" = queue.Queue()
+        for _ in range(4):
+            free.put(np.empty((height, width, 3), dtype=np.uint8))
+        frames: "queue.Queue" = queue.Queue()
+
+        def _decode():
+            read = cap.read
+            while True:
+                buf = free.get()
+                ret, frame = read(buf)
+                if not ret:
+                    break
+                frames.put(frame)
+            frames.put(None)
+
+        producer = threading.Thread(target=_decode, daemon=True)
+        producer.start()
+        write = proc.stdin.write
+        emit = self.progress_signal.emit
+        frame_count = 0
+        last_pct = -1
+        try:
+            while True:
+                frame = frames.get()
+                if frame is None:
+                    break
+                write(frame)
+                free.put(frame)
+                frame_count += 1
+                if total_frames > 0:
+                    pct = (frame_count * 100) // total_frames
+                    if pct != last_pct:
+                        emit(pct)
+                        last_pct = pct
+        except BrokenPipeError:
+            # Keep recycling buffers to the sentinel so a producer blocked
+            # on the free queue can finish and be joined.
+            while True:
+                frame = frames.get()
+                if frame is None:
+                    break
+                free.put(frame)
+        finally:
+            producer.join()
+            cap.release()
+            if proc.stdin:
+                proc.stdin.close()
+        _, stderr = proc.communicate()
+        if proc.returncode != 0:
+            return False, f"FFmpeg error: {stderr.decode('utf-8', errors='ignore')}"
         return True, f"Converted .seq to .mp4: {self.output_file}"
 
     def ffmpeg_video_convert(self) -> Tuple[bool, str]:
         """Transcode between common video formats via FFmpeg.
 
         FFmpeg is run with ``-progress pipe:1``; progress lines are parsed by
-        :meth:`handle_ffmpeg_output`. When writing MP4, use SLEAP‑recommended
-        H.264 settings for maximum compatibility.
+        :meth:`handle_ffmpeg_output`. When writing MP4, prefer a hardware H.264
+        encoder if one is available, else use SLEAP‑recommended settings for
+        maximum compatibility.
         """
         process = QProcess()
 
+        # Probe the input duration once so out_time_ms progress lines can be
+        # normalized; callers may also preset total_duration_ms themselves.
+        if self.total_duration_ms is None:
+            self.total_duration_ms = _probe_duration_us(self.input_file)
+
         # Base command (progress to stdout so we can parse it)
         cmd = [
             "ffmpeg",
             "-i",
-            str(self.input_file),
+            self._in,
             "-progress",
             "pipe:1",
         ]
 
-        # If the target is MP4, use SLEAP‑recommended encoding:
+        # For H.264-friendly containers, prefer a probed hardware encoder and
+        # otherwise use SLEAP‑recommended encoding:
         # ffmpeg -y -i input.mp4 -c:v libx264 -pix_fmt yuv420p -preset superfast -crf 23 output.mp4
-        if self.output_file.suffix.lower() == ".mp4":
-            cmd.extend(
-                [
-                    "-c:v",
-                    "libx264",
-                    "-pix_fmt",
-                    "yuv420p",
-                    "-preset",
-                    "superfast",
-                    "-crf",
-                    "23",
-                ]
-            )
+        if self._out_ext in (".mp4", ".mkv", ".mov"):
+            cmd.extend(_h264_encode_args(_detect_hw_encoder()))
 
         # Overwrite output
         cmd.extend(
             [
                 "-y",
-                str(self.output_file),
+                self._out,
             ]
         )
 
@@ -242,7 +779,9 @@ class ConversionThread(QThread):
         """Parse ``-progress`` lines from FFmpeg and emit percent complete.
 
         Expects lines of the form ``out_time_ms=<int>``. If :attr:`total_duration_ms`
-        is set, emits a normalized progress percentage.
+        is set, emits a normalized progress percentage. Emission is throttled
+        to integer-percent changes so long encodes don't flood the GUI event
+        loop with cross-thread signals.
         """
         output = process.readAllStandardOutput().data().decode()
         for line in output.splitlines():
@@ -251,22 +790,73 @@ class ConversionThread(QThread):
                     out_time_ms = int(line.split("=")[1])
                     if self.total_duration_ms:
                         percent = int((out_time_ms / self.total_duration_ms) * 100)
-                        self.progress_signal.emit(percent)
+                        if percent != self._last_pct:
+                            self.progress_signal.emit(percent)
+                            self._last_pct = percent
                 except Exception:
                     pass
 
     def image_to_image(self) -> Tuple[bool, str]:
         """Convert between common raster image formats using Pillow.
 
+        Opens with an explicit format hint (skipping Pillow's format-guessing
+        probe), enables JPEG draft-mode decoding, and favors fast encoder
+        settings on save (no extra Huffman pass for JPEG, low PNG compression).
+
         Returns:
             Tuple[bool, str]: Result flag and message.
 
         """
+        # libvips streams tile-by-tile, so peak memory is O(tile) rather than
+        # O(image) and large TIFF/PNG conversions use all cores. Optional;
+        # any failure falls through to the Pillow path below.
+        if self.cached_image is None:
+            try:
+                import pyvips
+            except ImportError:
+                pyvips = None
+            if pyvips is not None:
+                try:
+                    pyvips.Image.new_from_file(
+                        self._in, access="sequential"
+                    ).write_to_file(self._out)
+                    return True, f"Image conversion to {self.output_file} completed."
+                except Exception:
+                    pass
+        Image = _lazy_import("Image")
         try:
-            img = Image.open(self.input_file)
-            if img.mode in ["RGBA", "P"]:
+            img = self.cached_image
+            if img is None:
+                src_fmt = _PIL_FORMAT_BY_EXT.get(self._in_ext)
+                img = Image.open(
+                    self.input_file, formats=[src_fmt] if src_fmt else None
+                )
+                if img.format == "JPEG":
+                    img.draft("RGB", img.size)
+            target_fmt = _PIL_FORMAT_BY_EXT.get(self._out_ext, "JPEG")
+            if img.mode not in _MODE_OK.get(target_fmt, {"RGB"}):
                 img = img.convert("RGB")
-            img.save(self.output_file)
+            save_kwargs = {}
+            out_ext = self._out_ext
+            if out_ext in (".jpg", ".jpeg"):
+                tj = _get_turbojpeg()
+                if tj is not None:
+                    try:
+                        np = _lazy_import("np")
+                        # TurboJPEG expects BGR channel order.
+                        arr = np.asarray(img.convert("RGB"))[..., ::-1]
+                        with open(self._out, "wb") as f:
+                            f.write(tj.encode(np.ascontiguousarray(arr), quality=90))
+                        return (
+                            True,
+                            f"Image conversion to {self.output_file} completed.",
+                        )
+                    except Exception:
+                        pass
+                save_kwargs["optimize"] = False
+            elif out_ext == ".png":
+                save_kwargs["compress_level"] = 1
+            img.save(self.output_file, **save_kwargs)
             return True, f"Image conversion to {self.output_file} completed."
         except Exception as e:
             return False, f"Image conversion failed: {str(e)}"
@@ -274,13 +864,35 @@ class ConversionThread(QThread):
     def image_to_pdf(self) -> Tuple[bool, str]:
         """Write a single image to a single‑page PDF.
 
+        Prefers ``img2pdf``, which wraps the original compressed bytes in a
+        PDF container without decoding or re-encoding them — losslessly and
+        roughly an order of magnitude faster for JPEG input. Images it
+        refuses (e.g. alpha channels) fall back to the Pillow re-encode.
+
         Returns:
             Tuple[bool, str]: Result flag and message.
 
         """
         try:
-            img = Image.open(self.input_file)
-            if img.mode in ("RGBA", "P"):
+            import img2pdf
+        except ImportError:
+            img2pdf = None
+        if img2pdf is not None:
+            try:
+                with open(self._in, "rb") as f, open(self._out, "wb") as o:
+                    o.write(img2pdf.convert(f))
+                return (
+                    True,
+                    f"Image -> PDF conversion to {self.output_file} completed.",
+                )
+            except Exception:
+                pass
+        Image = _lazy_import("Image")
+        try:
+            img = self.cached_image
+            if img is None:
+                img = Image.open(self.input_file)
+            if img.mode not in _MODE_OK["PDF"]:
                 img = img.convert("RGB")
             img.save(self.output_file, "PDF")
             return True, f"Image -> PDF conversion to {self.output_file} completed."
@@ -290,24 +902,80 @@ class ConversionThread(QThread):
     def pdf_to_image(self) -> Tuple[bool, str]:
         """Export each page of a PDF to an image file.
 
-        The output filenames are suffixed ``_page0``, ``_page1``, etc.
+        For formats poppler can emit natively (PNG, JPEG, TIFF, PPM), pages are
+        written directly to disk by a single multi-threaded poppler invocation,
+        so no PIL decode/encode round-trip occurs and peak memory stays flat
+        regardless of page count. Other formats (e.g. BMP) fall back to the
+        Pillow path. The output filenames are suffixed ``_page0``, ``_page1``, etc.
 
         Returns:
             Tuple[bool, str]: Result flag and message.
 
         """
+        convert_from_path = _lazy_import("convert_from_path")
         try:
             base_name = self.output_file.stem
             out_dir = self.output_file.parent
             out_ext = self.output_file.suffix
-            images = convert_from_path(str(self.input_file))
+            fmt = out_ext.lstrip(".").lower()
+            if fmt == "jpg":
+                fmt = "jpeg"
+            # PyMuPDF renders pages straight to pixmaps in-process — no
+            # poppler child, no PIL round-trip. Optional; any failure falls
+            # through to the poppler/Pillow paths below.
+            if fmt in ("png", "jpeg", "ppm"):
+                try:
+                    import fitz
+
+                    doc = fitz.open(self._in)
+                    total = doc.page_count
+                    for i, page in enumerate(doc):
+                        pix = page.get_pixmap(dpi=200)
+                        pix.save(out_dir / f"{base_name}_page{i}{out_ext}")
+                        self.progress_signal.emit(((i + 1) * 100) // total)
+                    doc.close()
+                    if total:
+                        return True, f"PDF -> Image(s) in {out_dir} completed."
+                except Exception:
+                    pass
+            if fmt in ("png", "jpeg", "tiff", "ppm"):
+                paths = convert_from_path(
+                    self._in,
+                    output_folder=str(out_dir),
+                    fmt=fmt,
+                    output_file=f"{base_name}_page",
+                    paths_only=True,
+                    # Leave one core for the GUI thread and Qt event loop.
+                    thread_count=max(1, (os.cpu_count() or 2) - 1),
+                )
+                if not paths:
+                    return False, f"No images extracted from {self.input_file}."
+                total = len(paths)
+                for i, page_path in enumerate(sorted(paths)):
+                    os.replace(page_path, out_dir / f"{base_name}_page{i}{out_ext}")
+                    self.progress_signal.emit(((i + 1) * 100) // total)
+                return True, f"PDF -> Image(s) in {out_dir} completed."
+            images = convert_from_path(self._in)
             if not images:
                 return False, f"No images extracted from {self.input_file}."
-            for i, page_image in enumerate(images):
-                out_file = out_dir / f"{base_name}_page{i}{out_ext}"
+
+            # PIL encoders release the GIL, so page saves scale across cores.
+            total = len(images)
+            done = 0
+            lock = threading.Lock()
+
+            def _save_page(item):
+                nonlocal done
+                i, page_image = item
                 if page_image.mode in ("RGBA", "P"):
                     page_image = page_image.convert("RGB")
-                page_image.save(out_file)
+                page_image.save(out_dir / f"{base_name}_page{i}{out_ext}")
+                with lock:
+                    done += 1
+                    self.progress_signal.emit((done * 100) // total)
+
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as ex:
+                list(ex.map(_save_page, enumerate(images)))
             return True, f"PDF -> Image(s) in {out_dir} completed."
         except Exception as e:
             return False, f"PDF->Image conversion failed: {str(e)}"
@@ -319,10 +987,10 @@ class ConversionThread(QThread):
             Tuple[bool, str]: Result flag and message.
 
         """
+        pypandoc = _lazy_import("pypandoc")
+        _ensure_pandoc_path()
         try:
-            output = pypandoc.convert_file(
-                str(self.input_file), "docx", outputfile=str(self.output_file)
-            )
+            output = pypandoc.convert_file(self._in, "docx", outputfile=self._out)
             if output:
                 return False, f"pypandoc error: {output}"
             return True, f"PDF->DOCX conversion to {self.output_file} completed."
@@ -330,16 +998,31 @@ class ConversionThread(QThread):
             return False, f"PDF->DOCX failed: {str(e)}"
 
     def pdf_to_txt(self) -> Tuple[bool, str]:
-        """Extract text from a PDF into a ``.txt`` file via ``pypandoc``.
+        """Extract text from a PDF into a ``.txt`` file.
+
+        Prefers ``pdfminer.six``, which extracts plain text directly instead
+        of routing the document through pandoc's full AST and a subprocess;
+        falls back to ``pypandoc`` when pdfminer is not installed.
 
         Returns:
             Tuple[bool, str]: Result flag and message.
 
         """
         try:
-            output = pypandoc.convert_file(
-                str(self.input_file), "plain", outputfile=str(self.output_file)
-            )
+            from pdfminer.high_level import extract_text
+        except ImportError:
+            extract_text = None
+        if extract_text is not None:
+            try:
+                text = extract_text(self._in)
+                Path(self.output_file).write_text(text, encoding="utf-8")
+                return True, f"PDF->TXT conversion to {self.output_file} completed."
+            except Exception as e:
+                return False, f"PDF->TXT failed: {str(e)}"
+        pypandoc = _lazy_import("pypandoc")
+        _ensure_pandoc_path()
+        try:
+            output = pypandoc.convert_file(self._in, "plain", outputfile=self._out)
             if output:
                 return False, f"pypandoc error: {output}"
             return True, f"PDF->TXT conversion to {self.output_file} completed."
@@ -347,28 +1030,86 @@ class ConversionThread(QThread):
             return False, f"PDF->TXT failed: {str(e)}"
 
     def docx_to_pdf(self) -> Tuple[bool, str]:
-        """Convert a DOCX document to a PDF via ``docx2pdf``.
+        """Convert a DOCX document to a PDF.
+
+        Prefers a headless LibreOffice invocation, which avoids the multi-
+        second Word/COM (or AppleScript) launch that ``docx2pdf`` pays per
+        file; falls back to ``docx2pdf`` when ``soffice`` is not on ``PATH``.
 
         Returns:
             Tuple[bool, str]: Result flag and message.
 
         """
+        soffice = shutil.which("soffice")
+        if soffice:
+            try:
+                res = subprocess.run(
+                    [
+                        soffice,
+                        "--headless",
+                        "--nologo",
+                        "--convert-to",
+                        "pdf",
+                        "--outdir",
+                        str(self.output_file.parent),
+                        self._in,
+                    ],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=False,
+                )
+                # soffice names the output after the input stem.
+                produced = self.output_file.parent / (self.input_file.stem + ".pdf")
+                if res.returncode == 0 and produced.exists():
+                    if produced != self.output_file:
+                        os.replace(produced, self.output_file)
+                    return (
+                        True,
+                        f"DOCX->PDF conversion to {self.output_file} completed.",
+                    )
+            except OSError:
+                pass
+        docx2pdf_convert = _lazy_import("docx2pdf_convert")
         try:
-            docx2pdf_convert(str(self.input_file), str(self.output_file))
+            docx2pdf_convert(self._in, self._out)
             return True, f"DOCX->PDF conversion to {self.output_file} completed."
         except Exception as e:
             return False, f"DOCX->PDF failed: {str(e)}"
 
     def docx_to_txt(self) -> Tuple[bool, str]:
-        """Convert a DOCX document to plain text via ``pypandoc``.
+        """Convert a DOCX document to plain text.
+
+        Prefers ``python-docx`` paragraph iteration, which skips pandoc's
+        parse/render round-trip for what is a straight text dump; falls back
+        to ``pypandoc`` when python-docx is not installed.
 
         Returns:
             Tuple[bool, str]: Result flag and message.
 
         """
+        try:
+            from docx import Document
+        except ImportError:
+            Document = None
+        if Document is not None:
+            try:
+                doc = Document(self._in)
+                Path(self.output_file).write_text(
+                    "\n".join(p.text for p in doc.paragraphs), encoding="utf-8"
+                )
+                return True, f"DOCX->TXT conversion to {self.output_file} completed."
+            except Exception as e:
+                return False, f"DOCX->TXT failed: {str(e)}"
+        if _pandoc_server_convert(self.input_file, self.output_file, "docx", "plain"):
+            return True, f"DOCX->TXT conversion to {self.output_file} completed."
+        pypandoc = _lazy_import("pypandoc")
+        _ensure_pandoc_path()
         try:
             output = pypandoc.convert_file(
-                str(self.input_file), "plain", outputfile=str(self.output_file)
+                self._in,
+                "plain",
+                format="docx",
+                outputfile=self._out,
             )
             if output:
                 return False, f"pypandoc error: {output}"
@@ -383,9 +1124,14 @@ class ConversionThread(QThread):
             Tuple[bool, str]: Result flag and message.
 
         """
+        pypandoc = _lazy_import("pypandoc")
+        _ensure_pandoc_path()
         try:
             output = pypandoc.convert_file(
-                str(self.input_file), "pdf", outputfile=str(self.output_file)
+                self._in,
+                "pdf",
+                format="markdown",
+                outputfile=self._out,
             )
             if output:
                 return False, f"pypandoc error: {output}"
@@ -400,9 +1146,18 @@ class ConversionThread(QThread):
             Tuple[bool, str]: Result flag and message.
 
         """
+        if _pandoc_server_convert(
+            self.input_file, self.output_file, "markdown", "docx"
+        ):
+            return True, f"TXT->DOCX conversion to {self.output_file} completed."
+        pypandoc = _lazy_import("pypandoc")
+        _ensure_pandoc_path()
         try:
             output = pypandoc.convert_file(
-                str(self.input_file), "docx", outputfile=str(self.output_file)
+                self._in,
+                "docx",
+                format="markdown",
+                outputfile=self._out,
             )
             if output:
                 return False, f"pypandoc error: {output}"
@@ -413,33 +1168,180 @@ class ConversionThread(QThread):
     def generic_conversion(self) -> Tuple[bool, str]:
         """Fallback conversion using a simple FFmpeg invocation.
 
-        When the output is MP4, use SLEAP recommended H.264 settings
-        (libx264, yuv420p, preset=superfast, crf=23).
+        For MP4/MKV/MOV output, prefer a hardware H.264 encoder, falling back
+        to SLEAP recommended settings (libx264, yuv420p, preset=superfast,
+        crf=23).
 
         Returns:
             Tuple[bool, str]: Result flag and message.
 
         """
-        cmd = ["ffmpeg", "-i", str(self.input_file)]
-
-        # Apply SLEAP‑recommended settings when targeting MP4
-        if self.output_file.suffix.lower() == ".mp4":
-            cmd.extend(
-                [
-                    "-c:v",
-                    "libx264",
-                    "-pix_fmt",
-                    "yuv420p",
-                    "-preset",
-                    "superfast",
-                    "-crf",
-                    "23",
-                ]
-            )
-
-        cmd.extend(["-y", str(self.output_file)])
-        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        _, stderr = process.communicate()
-        if process.returncode != 0:
-            return False, f"FFmpeg error: {stderr.decode('utf-8')}"
+        cmd = ["ffmpeg", "-loglevel", "error", "-i", self._in]
+
+        # Prefer a hardware encoder (falling back to SLEAP‑recommended
+        # settings) for H.264-friendly containers
+        if self._out_ext in (".mp4", ".mkv", ".mov"):
+            cmd.extend(_h264_encode_args(_detect_hw_encoder()))
+
+        # Machine-readable progress on stdout; -loglevel error keeps stderr
+        # quiet so neither stream buffers megabytes of log spam.
+        cmd.extend(["-progress", "pipe:1", "-nostats", "-y", self._out])
+        duration_us = self.total_duration_ms or _probe_duration_us(self.input_file)
+        returncode, stderr = self._run_ffmpeg(cmd, duration_us)
+        if returncode != 0:
+            return False, f"FFmpeg error: {stderr}"
         return True, f"Generic conversion to {self.output_file} completed."
+
+
+class WorkerSignals(QObject):
+    """Signal holder for :class:`ConversionRunnable`.
+
+    ``QRunnable`` is not a ``QObject`` and cannot emit signals itself, so the
+    runnable carries one of these instead.
+
+    Attributes:
+        progress_signal (pyqtSignal): Percent complete updates (int).
+        finished_signal (pyqtSignal): Emitted once with (success, message).
+
+    """
+
+    progress_signal = pyqtSignal(int)
+    finished_signal = pyqtSignal(bool, str)
+
+
+class ConversionRunnable(QRunnable):
+    """Pooled counterpart to :class:`ConversionThread` for batch jobs.
+
+    Submitting these to ``QThreadPool.globalInstance()`` reuses a fixed set
+    of persistent worker threads (bounded by ``idealThreadCount()``) instead
+    of creating and tearing down one ``QThread`` per file, and lets several
+    conversions run concurrently.
+
+    Args:
+        input_file: Path to the source file.
+        output_file: Path to the destination file.
+        conversion_type: Conversion key (see :class:`ConversionThread`).
+
+    """
+
+    def __init__(
+        self,
+        input_file: Union[Path, str],
+        output_file: Union[Path, str],
+        conversion_type: str,
+    ):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.conversion_type = conversion_type
+        self._worker = ConversionThread(input_file, output_file, conversion_type)
+        self._worker.progress_signal.connect(self.signals.progress_signal)
+        self._worker.finished_signal.connect(self.signals.finished_signal)
+        # The submitter keeps a reference until finished_signal is delivered;
+        # auto-delete would free the signal holder while emits are queued.
+        self.setAutoDelete(False)
+
+    def run(self) -> None:
+        """Execute the wrapped conversion on a pool thread."""
+        self._worker.run()
+
+
+def docx_batch_to_pdf(input_files, output_dir: Union[Path, str]) -> Tuple[bool, str]:
+    """Convert many DOCX files to PDF with a single LibreOffice invocation.
+
+    ``soffice`` startup dominates small conversions, so passing the whole
+    batch to one ``--convert-to`` run pays it once instead of per file.
+
+    Args:
+        input_files: Iterable of DOCX paths to convert.
+        output_dir: Directory that receives the produced PDFs (named after
+            each input's stem).
+
+    Returns:
+        Tuple[bool, str]: Result flag and message. Fails when ``soffice`` is
+        not on ``PATH`` so callers can fall back to per-file conversion.
+
+    """
+    soffice = shutil.which("soffice")
+    if not soffice:
+        return False, "soffice not found on PATH."
+    files = [str(f) for f in input_files]
+    cmd = [
+        soffice,
+        "--headless",
+        "--nologo",
+        "--convert-to",
+        "pdf",
+        "--outdir",
+        str(output_dir),
+    ]
+    cmd.extend(files)
+    try:
+        res = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+    except OSError as e:
+        return False, f"soffice failed to start: {e}"
+    missing = [
+        f for f in files if not (Path(output_dir) / (Path(f).stem + ".pdf")).exists()
+    ]
+    if res.returncode != 0 or missing:
+        return False, (
+            f"soffice batch conversion failed (exit {res.returncode}); "
+            f"missing: {', '.join(missing) or 'none'}"
+        )
+    return True, f"Converted {len(files)} DOCX file(s) to PDF in {output_dir}."
+
+
+def video_batch_convert(jobs) -> Tuple[bool, str]:
+    """Convert several videos with a single FFmpeg invocation.
+
+    One process pays startup/probe cost once and shares FFmpeg's encoder
+    thread pool across all outputs, which beats N independent processes for
+    small and medium files.
+
+    Args:
+        jobs: Sequence of ``(input_path, output_path)`` pairs.
+
+    Returns:
+        Tuple[bool, str]: Result flag and message.
+
+    """
+    cmd = ["ffmpeg", "-y", "-loglevel", "error"]
+    for src, _ in jobs:
+        cmd.extend(["-i", str(src)])
+    for i, (_, dst) in enumerate(jobs):
+        out = str(dst).lower()
+        cmd.extend(["-map", f"{i}:v:0?"])
+        # GIF has no audio muxer; the '?' only tolerates a *missing* stream,
+        # so mapping audio from an input that has one would fail the run.
+        if out.endswith(".gif"):
+            cmd.append("-an")
+        else:
+            cmd.extend(["-map", f"{i}:a:0?"])
+        if out.endswith((".mp4", ".mkv", ".mov")):
+            cmd.extend(_h264_encode_args(_detect_hw_encoder()))
+        cmd.append(str(dst))
+    try:
+        res = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=False,
+        )
+    except OSError as e:
+        return False, f"FFmpeg failed to start: {e}"
+    if res.returncode == 0:
+        return True, f"Converted {len(jobs)} video file(s) in one FFmpeg run."
+    # A shared run fails as a unit, so one bad input would sink the whole
+    # batch; retry each file on its own and report only the real failures.
+    failures = []
+    for src, dst in jobs:
+        ok, msg = ConversionThread(src, dst, "video_to_video").ffmpeg_video_convert()
+        if not ok:
+            failures.append(f"{Path(src).name}: {msg}")
+    if failures:
+        return False, "FFmpeg error: " + "; ".join(failures)
+    return True, f"Converted {len(jobs)} video file(s) individually."
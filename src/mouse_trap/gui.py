@@ -1,9 +1,25 @@
 """Main window for converting files, clipping videos by annotations, and launching SLEAP tools."""
 
+import bisect
 import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from PyQt6.QtCore import pyqtSlot, Qt, QProcess
+from PyQt6.QtCore import (
+    pyqtSlot,
+    Qt,
+    QProcess,
+    QRunnable,
+    QSettings,
+    QThreadPool,
+    QTimer,
+)
 from PyQt6.QtGui import QFont, QPixmap
 from PyQt6.QtWidgets import (
     QAbstractItemView,
@@ -21,16 +37,429 @@ from PyQt6.QtWidgets import (
     QProgressBar,
     QPushButton,
     QSizePolicy,
+    QSpinBox,
     QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
-from .conversion import video_to_avi, ConversionThread
+from .conversion import (
+    _detect_hw_encoder,
+    _h264_encode_args,
+    ConversionThread,
+    ConversionRunnable,
+    WorkerSignals,
+    docx_batch_to_pdf,
+    video_batch_convert,
+)
 from .annotation import VideoAnnotationDialog
 from .sleap_cli import SleapBatchDialog, SleapBatchThread
 from .simba_labels import convert_caltech_to_simba_targets
-from typing import Dict, Tuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
+
+
+#: Map of input extension -> allowed output extensions. Module-level so the
+#: table (and the valid-pair set below) is built once, not per window.
+#: Values are tuples and the mapping is a read-only proxy, so the one shared
+#: table can never be mutated by accident from a window instance.
+OUTPUT_FORMATS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        ".seq": (".mp4", ".avi"),
+        ".avi": (".mp4", ".avi", ".mov", ".mkv", ".gif"),
+        ".mov": (".mp4", ".avi", ".mov", ".mkv", ".gif"),
+        ".mkv": (".mp4", ".avi", ".mov", ".mkv", ".gif"),
+        ".mp4": (".mp4", ".avi", ".mov", ".mkv", ".gif"),
+        ".jpg": (".jpg", ".png", ".tiff", ".bmp", ".pdf"),
+        ".jpeg": (".jpg", ".png", ".tiff", ".bmp", ".pdf"),
+        ".png": (".jpg", ".png", ".tiff", ".bmp", ".pdf"),
+        ".tiff": (".jpg", ".png", ".tiff", ".bmp", ".pdf"),
+        ".bmp": (".jpg", ".png", ".tiff", ".bmp", ".pdf"),
+        ".pdf": (".jpg", ".png", ".docx", ".txt"),
+        ".docx": (".pdf", ".txt"),
+        ".txt": (".pdf", ".docx"),
+    }
+)
+
+
+#: CSV annotation column suffixes as ``(suffix, strip length, field)``; walked
+#: once per header so row parsing never touches endswith/slicing again.
+_ANNOTATION_SUFFIXES = (("_in", 3, "enter"), ("_out", 4, "exit"))
+
+
+def _build_conversion_dispatch() -> Dict[Tuple[str, str], str]:
+    """Build the ``(input_ext, output_ext) -> conversion key`` lookup table.
+
+    Generic video/image pairs are filled in first; dedicated handlers then
+    override the specific pairs that have one.
+    """
+    video_exts = (".mp4", ".avi", ".mov", ".mkv", ".gif")
+    image_exts = (".jpg", ".jpeg", ".png", ".tiff", ".bmp")
+    dispatch: Dict[Tuple[str, str], str] = {}
+    for i in video_exts:
+        for o in video_exts:
+            dispatch[(i, o)] = "video_to_video"
+    for i in image_exts:
+        for o in image_exts:
+            dispatch[(i, o)] = "image_to_image"
+        dispatch[(i, ".pdf")] = "image_to_pdf"
+    for o in image_exts:
+        dispatch[(".pdf", o)] = "pdf_to_image"
+    dispatch.update(
+        {
+            (".seq", ".mp4"): "seq_to_mp4",
+            (".seq", ".avi"): "seq_to_avi",
+            (".mp4", ".avi"): "video_to_avi",
+            (".pdf", ".docx"): "pdf_to_docx",
+            (".pdf", ".txt"): "pdf_to_txt",
+            (".docx", ".pdf"): "docx_to_pdf",
+            (".docx", ".txt"): "docx_to_txt",
+            (".txt", ".pdf"): "txt_to_pdf",
+            (".txt", ".docx"): "txt_to_docx",
+        }
+    )
+    return dispatch
+
+
+def _clip_with_ffmpeg(
+    src: Path,
+    dst: Path,
+    enter_frame: int,
+    exit_frame: int,
+    fps: float,
+    allow_copy: bool = True,
+) -> bool:
+    """Cut one clip with FFmpeg ``-ss``/``-t`` instead of re-decoding in Python.
+
+    The MJPEG temp AVI is all keyframes, so ``-c copy`` is frame-accurate and
+    copies packets without decoding or re-encoding anything; when the copied
+    stream won't fit the target container, a fast libx264 transcode of just
+    the clipped span is tried before giving up. For long-GOP sources
+    (``allow_copy=False``) the copy step is skipped entirely: a packet copy
+    would snap to the nearest keyframe and start the clip seconds off, while
+    the input-seek transcode decodes from the prior keyframe and stays
+    frame-accurate. Returns ``False`` so callers can fall back to the OpenCV
+    writer loop.
+    """
+    start = (enter_frame - 1) / fps
+    duration = (exit_frame - enter_frame + 1) / fps
+    base = [
+        "ffmpeg",
+        "-loglevel",
+        "error",
+        "-ss",
+        f"{start:.6f}",
+        "-i",
+        str(src),
+        "-t",
+        f"{duration:.6f}",
+    ]
+    # make_zero rebases timestamps so players don't show a blank lead-in on
+    # copied cuts that start mid-stream.
+    copy_args = ["-c", "copy", "-avoid_negative_ts", "make_zero"]
+    attempts = [["-c:v", "libx264", "-preset", "veryfast"]]
+    if allow_copy:
+        attempts.insert(0, copy_args)
+    for codec_args in attempts:
+        try:
+            res = subprocess.run(
+                base + codec_args + ["-y", str(dst)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+        except OSError:
+            return False
+        if res.returncode == 0 and dst.exists() and dst.stat().st_size > 0:
+            return True
+    return False
+
+
+class _PyAVClipWriter:
+    """``cv2.VideoWriter``-compatible writer encoding in-process via PyAV.
+
+    libx264 with ``preset=ultrafast``/``tune=zerolatency`` beats OpenCV's
+    legacy ``mp4v`` encoder on both CPU time and bits per frame, and keeps
+    the whole encode inside the process — no pipe hop, no child process.
+    """
+
+    def __init__(self, path: Path, fps: float, size: Tuple[int, int]):
+        import av
+        from fractions import Fraction
+
+        self._av = av
+        width, height = size
+        self._container = av.open(str(path), "w")
+        self._stream = self._container.add_stream(
+            "libx264", rate=Fraction(fps).limit_denominator(1000)
+        )
+        self._stream.width = width
+        self._stream.height = height
+        self._stream.pix_fmt = "yuv420p"
+        self._stream.options = {"preset": "ultrafast", "tune": "zerolatency"}
+
+    def write(self, frame) -> None:
+        video_frame = self._av.VideoFrame.from_ndarray(frame, format="bgr24")
+        for packet in self._stream.encode(video_frame):
+            self._container.mux(packet)
+
+    def release(self) -> None:
+        for packet in self._stream.encode():
+            self._container.mux(packet)
+        self._container.close()
+
+
+class _FfmpegPipeWriter:
+    """``cv2.VideoWriter``-compatible writer piping raw BGR frames to ffmpeg.
+
+    ``stdin.write`` hands the frame to ffmpeg through the buffer protocol with
+    no intermediate copy, and ffmpeg downsamples to yuv420p in-process before
+    encoding — skipping OpenCV's own encoder plumbing entirely. Encoding uses
+    the probed hardware H.264 encoder (NVENC/QSV/VideoToolbox) when one is
+    present, falling back to libx264.
+    """
+
+    def __init__(self, path: Path, fps: float, size: Tuple[int, int]):
+        width, height = size
+        self._proc = subprocess.Popen(
+            [
+                "ffmpeg",
+                "-y",
+                "-loglevel",
+                "error",
+                "-f",
+                "rawvideo",
+                "-pix_fmt",
+                "bgr24",
+                "-s",
+                f"{width}x{height}",
+                "-r",
+                f"{fps:.6f}",
+                "-i",
+                "-",
+                *_h264_encode_args(_detect_hw_encoder()),
+                str(path),
+            ],
+            stdin=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1 << 20,
+        )
+
+    def write(self, frame) -> None:
+        try:
+            self._proc.stdin.write(frame)
+        except BrokenPipeError:
+            # The child is gone; release() reports the failure via the
+            # exit code once the remaining frames have been drained.
+            pass
+
+    def release(self) -> None:
+        try:
+            self._proc.stdin.close()
+        finally:
+            self._proc.wait()
+        if self._proc.returncode != 0:
+            raise OSError(
+                f"ffmpeg clip encoder exited with code {self._proc.returncode}"
+            )
+
+
+class _StagedClipWriter:
+    """Writer wrapper that encodes into scratch storage, then moves once.
+
+    Per-frame writes land on a RAM disk (or whatever ``MOUSE_TRAP_TMP``
+    points at); ``release`` finishes the encode and moves the file to its
+    real destination in one big sequential transfer, instead of trickling
+    thousands of small muxer flushes onto slow or networked storage.
+    """
+
+    def __init__(self, writer, tmp_path: Path, final_path: Path):
+        self._writer = writer
+        self._tmp_path = tmp_path
+        self._final_path = final_path
+
+    def write(self, frame) -> None:
+        self._writer.write(frame)
+
+    def release(self) -> None:
+        self._writer.release()
+        # Let a failed move (destination full, unwritable, ...) propagate:
+        # the clip pass reports it instead of claiming success while the
+        # finished clip sits stranded in scratch.
+        shutil.move(str(self._tmp_path), str(self._final_path))
+
+
+def _clip_scratch_dir() -> "Path | None":
+    """Return the RAM-backed scratch directory for clip staging, if any."""
+    override = os.environ.get("MOUSE_TRAP_TMP")
+    if override and os.path.isdir(override):
+        return Path(override)
+    if os.path.isdir("/dev/shm"):
+        return Path("/dev/shm")
+    return None
+
+
+def _open_clip_writer(cv2, path: Path, ext: str, fps: float, size: Tuple[int, int]):
+    """Open a clip writer for ``path``, staged through scratch when possible.
+
+    See :func:`_make_clip_writer` for encoder selection. When a RAM-backed
+    scratch directory exists the encode happens there and ``release`` moves
+    the finished file into place (:class:`_StagedClipWriter`).
+    """
+    scratch = _clip_scratch_dir()
+    if scratch is not None and scratch != path.parent:
+        tmp_path = scratch / f"mt_{os.getpid()}_{path.name}"
+        try:
+            return _StagedClipWriter(
+                _make_clip_writer(cv2, tmp_path, ext, fps, size), tmp_path, path
+            )
+        except Exception:
+            pass
+    return _make_clip_writer(cv2, path, ext, fps, size)
+
+
+def _make_clip_writer(cv2, path: Path, ext: str, fps: float, size: Tuple[int, int]):
+    """Open a ``cv2.VideoWriter`` for a clip, preferring H.264 output.
+
+    Requesting the ``avc1`` fourcc through the FFmpeg backend lets OpenCV
+    builds with hardware H.264 use it, roughly halving file size versus the
+    software MPEG-4 Part 2 (``mp4v``) encoder. Falls back codec by codec when
+    the build cannot encode H.264. AVI output keeps MJPG for frame-accurate
+    scrubbing downstream.
+    """
+    # With an NVIDIA GPU and ffmpegcv installed, hand encoding to NVENC;
+    # the writer is API-compatible with cv2.VideoWriter for write/release.
+    if ext != ".avi" and shutil.which("nvidia-smi"):
+        try:
+            import ffmpegcv
+
+            return ffmpegcv.VideoWriterNV(str(path), "h264_nvenc", fps)
+        except Exception:
+            pass
+    # PyAV (in-process libx264), then a raw-frame pipe to the system ffmpeg,
+    # both beat OpenCV's writer; AVI keeps MJPG below for frame-accurate
+    # scrubbing downstream.
+    if ext != ".avi":
+        try:
+            return _PyAVClipWriter(path, fps, size)
+        except Exception:
+            pass
+    if ext != ".avi" and shutil.which("ffmpeg"):
+        try:
+            return _FfmpegPipeWriter(path, fps, size)
+        except OSError:
+            pass
+    codecs = ("MJPG",) if ext == ".avi" else ("avc1", "mp4v")
+    for codec in codecs:
+        writer = cv2.VideoWriter(
+            str(path), cv2.CAP_FFMPEG, cv2.VideoWriter_fourcc(*codec), fps, size
+        )
+        if writer.isOpened():
+            return writer
+        writer.release()
+    # Last resort: let OpenCV pick the backend itself.
+    return cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+
+
+class _DocxBatchRunnable(QRunnable):
+    """Convert a batch of DOCX files to PDF with one soffice invocation.
+
+    LibreOffice startup dominates small conversions; the batch pays it once.
+    ``finished_signal`` is emitted once per input so the submitter's tally
+    lines up with per-file runnables.
+    """
+
+    conversion_type = "docx_to_pdf_batch"
+
+    def __init__(self, files, out_dir: Path):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self._files = list(files)
+        self._out_dir = out_dir
+        self.setAutoDelete(False)
+
+    def run(self) -> None:
+        ok, msg = docx_batch_to_pdf(self._files, self._out_dir)
+        for _ in self._files:
+            self.signals.finished_signal.emit(ok, msg)
+
+
+class _VideoBatchRunnable(QRunnable):
+    """Convert a batch of videos with one multi-output FFmpeg invocation.
+
+    FFmpeg shares its encoder thread pool across all mapped outputs and pays
+    process startup once. ``finished_signal`` is emitted once per input so
+    the submitter's tally lines up with per-file runnables.
+    """
+
+    conversion_type = "video_to_video_batch"
+
+    def __init__(self, jobs):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self._jobs = list(jobs)
+        self.setAutoDelete(False)
+
+    def run(self) -> None:
+        ok, msg = video_batch_convert(self._jobs)
+        for _ in self._jobs:
+            self.signals.finished_signal.emit(ok, msg)
+
+
+class _ClipRunnable(QRunnable):
+    """Run one annotation-clipping pass on the thread pool.
+
+    Clipping decodes and re-encodes video and can take minutes; running it
+    inline on the GUI thread froze the window. The destination directory is
+    resolved by the caller so no widget state is read off the main thread.
+    """
+
+    def __init__(
+        self, window: "MainWindow", annotations, video_path: Path, dest_dir: Path
+    ):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.setAutoDelete(False)
+        self._window = window
+        self._annotations = annotations
+        self._video_path = Path(video_path)
+        self._dest_dir = Path(dest_dir)
+
+    def run(self) -> None:
+        try:
+            ok, msg = self._window.clip_by_annotations(
+                self._annotations, self._video_path, self._dest_dir
+            )
+        except Exception as e:  # surface rather than die silently in the pool
+            ok, msg = False, f"Clipping failed: {e}"
+        self.signals.finished_signal.emit(ok, msg)
+
+
+class _ImagePrefetch(QRunnable):
+    """Decode a selected image off the GUI thread and park it in the cache.
+
+    Runs between file selection and the Convert click, so the first image
+    conversion usually finds its pixels already decoded.
+    """
+
+    def __init__(self, window: "MainWindow", path: Path):
+        super().__init__()
+        self._window = window
+        self._path = Path(path)
+
+    def run(self) -> None:
+        try:
+            from PIL import Image
+
+            mtime = os.path.getmtime(self._path)
+            img = Image.open(self._path)
+            img.load()
+        except Exception:
+            return
+        MainWindow._IMG_CACHE[(str(self._path), mtime)] = img
+        # Strong reference on the window keeps the weak entry alive until
+        # the next selection replaces it.
+        self._window._prefetched_image = img
 
 
 class MainWindow(QMainWindow):
@@ -52,10 +481,28 @@ class MainWindow(QMainWindow):
         current_file_index: Index into ``file_list`` for batch processing.
         temp_avi_file: Temporary MJPEG AVI used for precise frame scrubbing.
         csv_annotations_mapping: Optional mapping loaded from CSV.
-        OUTPUT_FORMATS: Map of input extension → list of allowed output extensions.
+        OUTPUT_FORMATS: Map of input extension → tuple of allowed output extensions.
 
     """
 
+    #: Scaled logo pixmaps keyed by (path, mtime, height); shared across
+    #: window instances so repeat constructions skip the decode + smooth scale.
+    _LOGO_CACHE: Dict[Tuple[str, float, int], QPixmap] = {}
+
+    #: Precomputed (input_ext, output_ext) -> conversion key, built once at
+    #: class load so the per-click lookup is O(1).
+    _DISPATCH: Dict[Tuple[str, str], str] = _build_conversion_dispatch()
+
+    #: Decoded images keyed by (path, mtime), shared across windows. Entries
+    #: live only while something (e.g. _prefetched_image) holds the image.
+    _IMG_CACHE: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+
+    OUTPUT_FORMATS = OUTPUT_FORMATS
+
+    #: Supported (input_ext, output_ext) pairs, precomputed so the Convert
+    #: button can be gated without spawning a doomed ffmpeg process.
+    _VALID_PAIRS = frozenset((i, o) for i, outs in OUTPUT_FORMATS.items() for o in outs)
+
     def __init__(self) -> None:
         """Build the UI and initialize state."""
         super().__init__()
@@ -72,10 +519,14 @@ class MainWindow(QMainWindow):
         # Locate logo relative to this module (safe inside a package)
         logo_path = Path(__file__).parent / "media" / "nih_logo.png"
         if logo_path.exists():
-            pixmap = QPixmap(str(logo_path))
-            self.logo_label.setPixmap(
-                pixmap.scaledToHeight(50, Qt.TransformationMode.SmoothTransformation)
-            )
+            key = (str(logo_path), os.path.getmtime(logo_path), 50)
+            pixmap = self._LOGO_CACHE.get(key)
+            if pixmap is None:
+                pixmap = QPixmap(str(logo_path)).scaledToHeight(
+                    50, Qt.TransformationMode.SmoothTransformation
+                )
+                self._LOGO_CACHE[key] = pixmap
+            self.logo_label.setPixmap(pixmap)
         banner_layout.addWidget(self.logo_label)
         banner_label = QLabel("Multi-Format File Converter & Video Annotator")
         banner_label.setStyleSheet("font-size: 24px; font-weight: bold; color: white;")
@@ -113,6 +564,15 @@ class MainWindow(QMainWindow):
         self.output_folder_button.setEnabled(False)
         self.output_folder_button.clicked.connect(self.select_output_folder)
         options_layout.addWidget(self.output_folder_button)
+        options_layout.addWidget(QLabel("Parallel jobs:"))
+        self.jobs_spinbox = QSpinBox()
+        self.jobs_spinbox.setRange(1, max(1, os.cpu_count() or 1))
+        # Leave one core for the GUI thread by default.
+        self.jobs_spinbox.setValue(max(1, (os.cpu_count() or 2) - 1))
+        self.jobs_spinbox.setToolTip(
+            "How many files to convert at once in unprompted batches."
+        )
+        options_layout.addWidget(self.jobs_spinbox)
         options_layout.addStretch()
         options_group_layout.addLayout(options_layout)
         self.output_folder_checkbox.stateChanged.connect(
@@ -123,13 +583,13 @@ class MainWindow(QMainWindow):
         self.clip_checkbox = QCheckBox("Clip")
         annotation_layout.addWidget(self.clip_checkbox)
 
+        # One policy value shared by every fixed-size button below.
+        fixed_policy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         self.select_annotation_file_button = QPushButton("Import CSV Annotations")
         self.select_annotation_file_button.clicked.connect(
             self.import_csv_annotations_multi
         )
-        self.select_annotation_file_button.setSizePolicy(
-            QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        )
+        self.select_annotation_file_button.setSizePolicy(fixed_policy)
         annotation_layout.addWidget(self.select_annotation_file_button)
 
         # Caltech -> SimBA label conversion helper
@@ -139,23 +599,17 @@ class MainWindow(QMainWindow):
             "Convert Caltech Behavior Annotator .txt + SimBA features_extracted CSV "
             "into a SimBA targets_inserted CSV."
         )
-        self.simba_convert_button.setSizePolicy(
-            QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        )
+        self.simba_convert_button.setSizePolicy(fixed_policy)
         annotation_layout.addWidget(self.simba_convert_button)
 
         self.sleap_button = QPushButton("Launch SLEAP")
         self.sleap_button.clicked.connect(self.launch_sleap)
         self.sleap_button.clicked.connect(self.launch_sleap)
-        self.sleap_button.setSizePolicy(
-            QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        )
+        self.sleap_button.setSizePolicy(fixed_policy)
         annotation_layout.addWidget(self.sleap_button)
         self.sleap_batch_button = QPushButton("Run SLEAP Inference")
         self.sleap_batch_button.clicked.connect(self.start_sleap_batch)
-        self.sleap_batch_button.setSizePolicy(
-            QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        )
+        self.sleap_batch_button.setSizePolicy(fixed_policy)
         annotation_layout.addWidget(self.sleap_batch_button)
 
         annotation_layout.addStretch()
@@ -190,11 +644,19 @@ class MainWindow(QMainWindow):
         bottom_container.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed
         )
-        bottom_container.setMaximumHeight(bottom_container.sizeHint().height())
+        # The height cap is applied from showEvent: asking for sizeHint here
+        # would force a full layout pass before styles are applied, and the
+        # pre-style value can be wrong on HiDPI displays.
+        self._bottom_container = bottom_container
+        self._bottom_height_pending = True
         main_layout.addWidget(bottom_container, 0)
 
         self.input_file = None
         self.input_files = None
+        # Remember where the user last browsed across sessions, so the first
+        # file dialog of a run opens warm instead of scanning $HOME.
+        self.settings = QSettings("NIEHS", "MouseTrap")
+        self._last_dir = Path(self.settings.value("last_dir", str(Path.home())))
         self.output_file = None
         self.output_folder = None
         self.current_extension = None
@@ -203,24 +665,27 @@ class MainWindow(QMainWindow):
         self.annotation_file = None
         self.temp_avi_file = None
         self.csv_annotations_mapping = {}
+        # Open VideoCapture handles keyed by path, small LRU. Container probe
+        # and codec init cost real time per open, so repeat clipping runs on
+        # the same source reuse the handle instead of reopening it.
+        self._cap_cache = {}
 
-        self.OUTPUT_FORMATS = {
-            ".seq": [".mp4", ".avi"],
-            ".avi": [".mp4", ".avi", ".mov", ".mkv", ".gif"],
-            ".mov": [".mp4", ".avi", ".mov", ".mkv", ".gif"],
-            ".mkv": [".mp4", ".avi", ".mov", ".mkv", ".gif"],
-            ".mp4": [".mp4", ".avi", ".mov", ".mkv", ".gif"],
-            ".jpg": [".jpg", ".png", ".tiff", ".bmp", ".pdf"],
-            ".jpeg": [".jpg", ".png", ".tiff", ".bmp", ".pdf"],
-            ".png": [".jpg", ".png", ".tiff", ".bmp", ".pdf"],
-            ".tiff": [".jpg", ".png", ".tiff", ".bmp", ".pdf"],
-            ".bmp": [".jpg", ".png", ".tiff", ".bmp", ".pdf"],
-            ".pdf": [".jpg", ".png", ".docx", ".txt"],
-            ".docx": [".pdf", ".txt"],
-            ".txt": [".pdf", ".docx"],
-        }
+        self.output_combo.currentTextChanged.connect(self._update_convert_enabled)
         self.setStyleSheet("QMainWindow { background-color: #FFFFFF; }")
 
+    def showEvent(self, event) -> None:
+        """Defer the bottom-container height cap past the first layout pass."""
+        super().showEvent(event)
+        if self._bottom_height_pending:
+            self._bottom_height_pending = False
+            QTimer.singleShot(0, self._finalize_bottom_container_height)
+
+    def _finalize_bottom_container_height(self) -> None:
+        """Cap the bottom container at its post-style ``sizeHint`` height."""
+        self._bottom_container.setMaximumHeight(
+            self._bottom_container.sizeHint().height()
+        )
+
     def _append_console(self, s: str) -> None:
         """Append a single line to the scrollback console.
 
@@ -258,11 +723,19 @@ class MainWindow(QMainWindow):
             self.output_folder_button.setEnabled(False)
             self.output_folder = None
 
+    def _remember_dir(self, path: Path) -> None:
+        """Record ``path`` as the last-browsed directory, persisted via QSettings."""
+        self._last_dir = Path(path)
+        self.settings.setValue("last_dir", str(self._last_dir))
+
     def select_output_folder(self) -> None:
         """Open a folder picker and save the chosen directory as the output target."""
-        folder = QFileDialog.getExistingDirectory(self, "Select Output Folder")
+        folder = QFileDialog.getExistingDirectory(
+            self, "Select Output Folder", str(self._last_dir)
+        )
         if folder:
             self.output_folder = folder
+            self._remember_dir(Path(folder))
 
     def select_file(self) -> None:
         """Pick one or many input files and refresh allowed output formats.
@@ -270,24 +743,36 @@ class MainWindow(QMainWindow):
         Behavior depends on the Select Multiple Files checkbox. When multiple
         files are selected, the first file determines the output-format menu.
         """
-        file_dialog = QFileDialog()
+        # getOpenFileName(s) are static — instantiating QFileDialog first just
+        # preloaded native dialog resources that were never used. Starting in
+        # the last-used directory also spares the dialog a cold walk of $HOME.
         if self.multiple_files_checkbox.isChecked():
-            file_paths, _ = file_dialog.getOpenFileNames(
-                self, "Select files to convert"
+            file_paths, _ = QFileDialog.getOpenFileNames(
+                self, "Select files to convert", str(self._last_dir)
             )
             if file_paths:
                 self.input_files = [Path(fp) for fp in file_paths]
+                self._remember_dir(self.input_files[0].parent)
                 self.file_label.setText(f"{len(self.input_files)} files selected")
                 self.input_file = self.input_files[0]
-                self.current_extension = self.input_file.suffix.lower()
-                self.update_output_options()
+                new_ext = self.input_file.suffix.lower()
+                if new_ext != self.current_extension:
+                    self.current_extension = new_ext
+                    self.update_output_options()
+                self._prefetch_image(self.input_file)
         else:
-            file_path, _ = file_dialog.getOpenFileName(self, "Select a file to convert")
+            file_path, _ = QFileDialog.getOpenFileName(
+                self, "Select a file to convert", str(self._last_dir)
+            )
             if file_path:
                 self.input_file = Path(file_path)
+                self._remember_dir(self.input_file.parent)
                 self.file_label.setText(self.input_file.name)
-                self.current_extension = self.input_file.suffix.lower()
-                self.update_output_options()
+                new_ext = self.input_file.suffix.lower()
+                if new_ext != self.current_extension:
+                    self.current_extension = new_ext
+                    self.update_output_options()
+                self._prefetch_image(self.input_file)
 
     def select_folders_and_filter(self) -> None:
         """Queue files from one or more folders filtered by extension.
@@ -321,18 +806,24 @@ class MainWindow(QMainWindow):
         recursive = (
             hasattr(self, "recursive_checkbox") and self.recursive_checkbox.isChecked()
         )
+        # scandir-based walks read each directory once and answer is_file()
+        # from the directory entry itself; the old iterdir/rglob loop paid a
+        # stat() per candidate, which adds up on network mounts.
         filtered_files = []
         for folder_path in folders:
-            if not (folder_path.exists() and folder_path.is_dir()):
+            if not folder_path.is_dir():
                 continue
             if recursive:
-                for f in folder_path.rglob("*"):
-                    if f.is_file() and f.suffix.lower() == ext:
-                        filtered_files.append(f)
+                for root, _dirs, files in os.walk(folder_path):
+                    root_path = Path(root)
+                    for name in files:
+                        if name.lower().endswith(ext):
+                            filtered_files.append(root_path / name)
             else:
-                for f in folder_path.iterdir():
-                    if f.is_file() and f.suffix.lower() == ext:
-                        filtered_files.append(f)
+                with os.scandir(folder_path) as entries:
+                    for entry in entries:
+                        if entry.name.lower().endswith(ext) and entry.is_file():
+                            filtered_files.append(Path(entry.path))
         seen = set()
         filtered_files = [f for f in filtered_files if not (f in seen or seen.add(f))]
         if filtered_files:
@@ -352,16 +843,49 @@ class MainWindow(QMainWindow):
                 + (" (recursive)." if recursive else "."),
             )
 
+    def _prefetch_image(self, path: Path) -> None:
+        """Start a background decode for an image selection (no-op otherwise)."""
+        self._prefetched_image = None
+        if path.suffix.lower() in (".jpg", ".jpeg", ".png", ".tiff", ".bmp"):
+            QThreadPool.globalInstance().start(_ImagePrefetch(self, path))
+
+    def _cached_image_for(self, path: Path):
+        """Return the cached decoded image for ``path``, or ``None`` on a miss."""
+        try:
+            key = (str(path), os.path.getmtime(path))
+        except OSError:
+            return None
+        return self._IMG_CACHE.get(key)
+
     def update_output_options(self) -> None:
         """Populate the Output Format combo for the active input extension.
 
-        If the extension is unknown, defaults to ``.mp4``.
+        If the extension is unknown, defaults to ``.mp4``. Repopulating is
+        skipped when the combo already holds the wanted items, since
+        ``clear``/``addItems`` trigger a model reset and repaint.
         """
+        wanted = self.OUTPUT_FORMATS.get(self.current_extension, (".mp4",))
+        current = tuple(
+            self.output_combo.itemText(i) for i in range(self.output_combo.count())
+        )
+        if current == wanted:
+            self._update_convert_enabled()
+            return
+        # clear() then addItems() emit a signal per step (index change, text
+        # change, model reset); repopulate quietly and run the one dependent
+        # update directly instead of once per emission.
+        self.output_combo.blockSignals(True)
         self.output_combo.clear()
-        if self.current_extension in self.OUTPUT_FORMATS:
-            self.output_combo.addItems(self.OUTPUT_FORMATS[self.current_extension])
-        else:
-            self.output_combo.addItem(".mp4")
+        self.output_combo.addItems(list(wanted))
+        self.output_combo.blockSignals(False)
+        self._update_convert_enabled()
+
+    def _update_convert_enabled(self) -> None:
+        """Enable Convert only for supported input/output extension pairs."""
+        if self.current_extension is None:
+            return
+        pair = (self.current_extension, self.output_combo.currentText())
+        self.convert_button.setEnabled(pair in self._VALID_PAIRS)
 
     def import_csv_annotations_multi(self) -> None:
         """Load (per-file) intruder intervals from a CSV into memory.
@@ -371,7 +895,10 @@ class MainWindow(QMainWindow):
         in-memory mapping is updated on success.
         """
         fileName, _ = QFileDialog.getOpenFileName(
-            self, "Import CSV Annotations for Multiple Files", "", "CSV Files (*.csv)"
+            self,
+            "Import CSV Annotations for Multiple Files",
+            str(self._last_dir),
+            "CSV Files (*.csv)",
         )
         if not fileName:
             return
@@ -382,34 +909,40 @@ class MainWindow(QMainWindow):
             with open(fileName, newline="", encoding="utf-8-sig") as csvfile:
                 reader = csv.DictReader(csvfile)
                 headers = reader.fieldnames
-                if headers is None or "file_name" not in [h.strip() for h in headers]:
+                # Membership against a frozenset rather than a fresh list of
+                # stripped headers on every check.
+                header_set = frozenset(h.strip() for h in headers or ())
+                if "file_name" not in header_set:
                     QMessageBox.critical(
                         self,
                         "CSV Error",
                         f"CSV must include a 'file_name' column. Found headers: {headers}",
                     )
                     return
+                # Classify the columns once up front so the per-row loop is
+                # a plain list walk instead of strip/endswith on every cell.
+                columns = []
+                for header in headers:
+                    key_clean = header.strip()
+                    for suffix, n, field in _ANNOTATION_SUFFIXES:
+                        if key_clean.endswith(suffix):
+                            columns.append((header, key_clean[:-n], field))
+                            break
                 for row in reader:
                     fname = row.get("file_name", "").strip()
                     if not fname:
                         continue
                     annotations = {}
-                    for key, value in row.items():
-                        key_clean = key.strip()
-                        if key_clean == "file_name":
-                            continue
-                        if value.strip() == "":
+                    for header, intruder, field in columns:
+                        value = row.get(header, "").strip()
+                        if not value:
                             continue
-                        if key_clean.endswith("_in"):
-                            intruder = key_clean[:-3]
-                            if intruder not in annotations:
-                                annotations[intruder] = {}
-                            annotations[intruder]["enter"] = int(value)
-                        elif key_clean.endswith("_out"):
-                            intruder = key_clean[:-4]
-                            if intruder not in annotations:
-                                annotations[intruder] = {}
-                            annotations[intruder]["exit"] = int(value)
+                        # get-then-insert rather than setdefault: one lookup
+                        # and no throwaway dict allocation on the hot path.
+                        entry = annotations.get(intruder)
+                        if entry is None:
+                            entry = annotations[intruder] = {}
+                        entry[field] = int(value)
                     mapping[fname] = annotations
         except Exception as e:
             QMessageBox.critical(self, "CSV Error", f"Error reading CSV: {str(e)}")
@@ -538,6 +1071,15 @@ class MainWindow(QMainWindow):
         standard conversion workflow via :class:`ConversionThread`. Advances
         the queue and updates progress UI accordingly.
         """
+        # Unprompted, non-clipping batches fan out across the shared thread
+        # pool; prompted runs stay sequential so dialogs arrive one at a time.
+        if (
+            not self.prompt_on_each_file
+            and not self.clip_checkbox.isChecked()
+            and len(self.file_list) - self.current_file_index > 1
+        ):
+            self._start_batch_pool()
+            return
         if self.current_file_index < len(self.file_list):
             self.input_file = self.file_list[self.current_file_index]
             self.current_extension = self.input_file.suffix.lower()
@@ -594,47 +1136,39 @@ class MainWindow(QMainWindow):
                     self.convert_button.setEnabled(True)
                     self.select_file_button.setEnabled(True)
                     return
-                if self.current_extension in [".seq", ".mp4"]:
-                    self.temp_avi_file = self.input_file.parent / (
-                        self.input_file.stem + "_temp.avi"
+                if self.current_extension == ".seq":
+                    # The scratch AVI is written once and read back twice
+                    # (annotation dialog + clipper) before being deleted, so
+                    # keep it on fast local temp storage rather than next to
+                    # a source that may live on a network share. MOUSE_TRAP_TMP
+                    # lets users point it at /dev/shm or an NVMe scratch disk.
+                    tmp_dir = Path(
+                        os.environ.get("MOUSE_TRAP_TMP") or tempfile.gettempdir()
                     )
-                    success, message = video_to_avi(self.input_file, self.temp_avi_file)
-                    if not success:
-                        QMessageBox.critical(self, "Error", message)
-                        self.convert_button.setEnabled(True)
-                        self.select_file_button.setEnabled(True)
-                        return
-                elif self.current_extension == ".avi":
-                    self.temp_avi_file = self.input_file
-
-                annot_dialog = VideoAnnotationDialog(self.temp_avi_file)
-                key = self.input_file.stem
-                if self.csv_annotations_mapping and key in self.csv_annotations_mapping:
-                    annot_dialog.annotations.update(self.csv_annotations_mapping[key])
-                if annot_dialog.exec() == QDialog.DialogCode.Accepted:
-                    annotations = annot_dialog.annotations
-                    success, message = self.clip_by_annotations(
-                        annotations, self.temp_avi_file
+                    self.temp_avi_file = tmp_dir / (self.input_file.stem + "_temp.avi")
+                    # Transcode on a worker thread: calling video_to_avi here
+                    # would block the GUI thread in waitForFinished, so the
+                    # progress updates would never paint. The clip workflow
+                    # resumes in _on_temp_avi_ready.
+                    self.thread = ConversionThread(
+                        input_file=self.input_file,
+                        output_file=self.temp_avi_file,
+                        conversion_type="video_to_avi",
                     )
-                    if success:
-                        QMessageBox.information(self, "Success", message)
-                    else:
-                        QMessageBox.critical(self, "Error", message)
-                else:
-                    QMessageBox.warning(self, "Annotation", "Annotation cancelled.")
-
-                try:
-                    if (
-                        self.current_extension in [".seq", ".mp4"]
-                        and self.temp_avi_file.exists()
-                    ):
-                        os.remove(self.temp_avi_file)
-                except Exception:
-                    pass
-
-                self.current_file_index += 1
-                self.progress_bar.setValue(0)
-                self.process_next_file()
+                    self.thread.progress_signal.connect(
+                        self.update_progress, Qt.ConnectionType.QueuedConnection
+                    )
+                    self.thread.finished_signal.connect(self._on_temp_avi_ready)
+                    self.convert_button.setEnabled(False)
+                    self.select_file_button.setEnabled(False)
+                    self.thread.start()
+                    return
+                # .mp4/.avi are annotated and clipped in place: the
+                # media-player dialog and both clip paths (packet cut,
+                # OpenCV decode) handle them directly, so transcoding to
+                # an intermediate AVI would just triple the decode work.
+                self.temp_avi_file = self.input_file
+                self._run_annotation_and_clip()
                 return
 
             conversion_type = self.determine_conversion_type(
@@ -644,8 +1178,11 @@ class MainWindow(QMainWindow):
                 input_file=self.input_file,
                 output_file=self.output_file,
                 conversion_type=conversion_type,
+                cached_image=self._cached_image_for(self.input_file),
+            )
+            self.thread.progress_signal.connect(
+                self.update_progress, Qt.ConnectionType.QueuedConnection
             )
-            self.thread.progress_signal.connect(self.update_progress)
             self.thread.finished_signal.connect(self.on_conversion_finished)
             self.convert_button.setEnabled(False)
             self.select_file_button.setEnabled(False)
@@ -655,6 +1192,114 @@ class MainWindow(QMainWindow):
             self.convert_button.setEnabled(True)
             self.select_file_button.setEnabled(True)
 
+    def _start_batch_pool(self) -> None:
+        """Submit every remaining queued file to the global thread pool.
+
+        ``QThreadPool`` reuses persistent workers bounded by
+        ``idealThreadCount()``, so batch jobs run concurrently instead of one
+        fresh ``QThread`` per file in series. The progress bar tracks files
+        completed rather than per-file percent.
+        """
+        output_ext = self.output_combo.currentText()
+        pending = self.file_list[self.current_file_index :]
+        self._pool_total = len(pending)
+        self._pool_done = 0
+        self._pool_failures = []
+        # Keep the runnables alive until their queued signals are delivered.
+        self._pool_runnables = []
+        self.convert_button.setEnabled(False)
+        self.select_file_button.setEnabled(False)
+        use_outdir = bool(
+            self.output_folder and self.output_folder_checkbox.isChecked()
+        )
+        # DOCX->PDF batches collapse into one soffice run when every output
+        # lands in the same chosen folder; plain video transcodes collapse
+        # into one multi-output ffmpeg run.
+        docx_batch = []
+        video_jobs = []
+        for input_file in pending:
+            if use_outdir:
+                output_file = Path(self.output_folder) / (input_file.stem + output_ext)
+            else:
+                output_file = input_file.with_suffix(output_ext)
+            conversion_type = self.determine_conversion_type(
+                input_file.suffix.lower(), output_ext
+            )
+            if (
+                conversion_type == "docx_to_pdf"
+                and use_outdir
+                and shutil.which("soffice")
+            ):
+                docx_batch.append(input_file)
+                continue
+            if conversion_type == "video_to_video":
+                video_jobs.append((input_file, output_file))
+                continue
+            runnable = ConversionRunnable(
+                input_file=input_file,
+                output_file=output_file,
+                conversion_type=conversion_type,
+            )
+            runnable.signals.finished_signal.connect(
+                self.on_pool_conversion_finished, Qt.ConnectionType.QueuedConnection
+            )
+            self._pool_runnables.append(runnable)
+        if docx_batch:
+            batch = _DocxBatchRunnable(docx_batch, Path(self.output_folder))
+            batch.signals.finished_signal.connect(
+                self.on_pool_conversion_finished, Qt.ConnectionType.QueuedConnection
+            )
+            self._pool_runnables.append(batch)
+        if len(video_jobs) == 1:
+            # A single file gains nothing from grouping; use the normal path.
+            src, dst = video_jobs[0]
+            runnable = ConversionRunnable(
+                input_file=src, output_file=dst, conversion_type="video_to_video"
+            )
+            runnable.signals.finished_signal.connect(
+                self.on_pool_conversion_finished, Qt.ConnectionType.QueuedConnection
+            )
+            self._pool_runnables.append(runnable)
+        elif video_jobs:
+            batch = _VideoBatchRunnable(video_jobs)
+            batch.signals.finished_signal.connect(
+                self.on_pool_conversion_finished, Qt.ConnectionType.QueuedConnection
+            )
+            self._pool_runnables.append(batch)
+        pool = QThreadPool.globalInstance()
+        # CPU-bound jobs (PDF rendering, image codecs) release the GIL in C,
+        # so they scale across cores; the spinbox lets users dial the width
+        # down on shared machines. Its default leaves one core for the GUI.
+        pool.setMaxThreadCount(min(self._pool_total, self.jobs_spinbox.value()))
+        if not hasattr(self, "_serial_pool"):
+            # docx2pdf drives Word over COM on Windows and must not run
+            # concurrently with itself; give it a one-slot pool of its own.
+            self._serial_pool = QThreadPool(self)
+            self._serial_pool.setMaxThreadCount(1)
+        for runnable in self._pool_runnables:
+            if runnable.conversion_type == "docx_to_pdf":
+                self._serial_pool.start(runnable)
+            else:
+                pool.start(runnable)
+
+    @pyqtSlot(bool, str)
+    def on_pool_conversion_finished(self, success: bool, message: str) -> None:
+        """Tally one pooled conversion and close out the batch when done."""
+        self._pool_done += 1
+        if not success:
+            self._pool_failures.append(message)
+        self.progress_bar.setValue((self._pool_done * 100) // self._pool_total)
+        if self._pool_done < self._pool_total:
+            return
+        self._pool_runnables = []
+        self.progress_bar.setValue(0)
+        self.convert_button.setEnabled(True)
+        self.select_file_button.setEnabled(True)
+        if self._pool_failures:
+            QMessageBox.critical(self, "Error", "\n".join(self._pool_failures))
+        else:
+            QMessageBox.information(self, "Success", "All conversions completed.")
+
     def determine_conversion_type(self, input_ext: str, output_ext: str) -> str:
         """Return the conversion key for a given input/output pair.
 
@@ -666,41 +1311,95 @@ class MainWindow(QMainWindow):
             A conversion key such as ``"video_to_video"``.
 
         """
-        if input_ext == ".seq" and output_ext == ".mp4":
-            return "seq_to_mp4"
-        elif input_ext == ".seq" and output_ext == ".avi":
-            return "seq_to_avi"
-        elif input_ext == ".mp4" and output_ext == ".avi":
-            return "video_to_avi"
-        video_exts = [".mp4", ".avi", ".mov", ".mkv", ".gif"]
-        if input_ext in video_exts and output_ext in video_exts:
-            return "video_to_video"
-        image_exts = [".jpg", ".jpeg", ".png", ".tiff", ".bmp"]
-        if input_ext in image_exts and output_ext in image_exts:
-            return "image_to_image"
-        if input_ext in image_exts and output_ext == ".pdf":
-            return "image_to_pdf"
-        if input_ext == ".pdf" and output_ext in image_exts:
-            return "pdf_to_image"
-        if input_ext == ".pdf" and output_ext == ".docx":
-            return "pdf_to_docx"
-        if input_ext == ".pdf" and output_ext == ".txt":
-            return "pdf_to_txt"
-        if input_ext == ".docx" and output_ext == ".pdf":
-            return "docx_to_pdf"
-        if input_ext == ".docx" and output_ext == ".txt":
-            return "docx_to_txt"
-        if input_ext == ".txt" and output_ext == ".pdf":
-            return "txt_to_pdf"
-        if input_ext == ".txt" and output_ext == ".docx":
-            return "txt_to_docx"
-        return "generic_conversion"
+        return self._DISPATCH.get((input_ext, output_ext), "generic_conversion")
 
     @pyqtSlot(int)
     def update_progress(self, value: int) -> None:
         """Update the progress bar to ``value`` percent."""
         self.progress_bar.setValue(value)
 
+    @pyqtSlot(bool, str)
+    def _on_temp_avi_ready(self, success: bool, message: str) -> None:
+        """Resume the clip workflow once the scratch AVI transcode finishes."""
+        if not success:
+            QMessageBox.critical(self, "Error", message)
+            self.convert_button.setEnabled(True)
+            self.select_file_button.setEnabled(True)
+            return
+        self.progress_bar.setValue(0)
+        self._run_annotation_and_clip()
+
+    def _run_annotation_and_clip(self) -> None:
+        """Collect annotations for the current source and launch the clip pass.
+
+        Opens the annotation dialog on :attr:`temp_avi_file` (the scratch AVI
+        for ``.seq`` inputs, the original file otherwise). On accept, hands
+        the clip pass to the thread pool; cleanup and queue advance happen in
+        :meth:`_on_clip_finished`. On cancel, advances the queue directly.
+        """
+        annot_dialog = VideoAnnotationDialog(self.temp_avi_file)
+        key = self.input_file.stem
+        if self.csv_annotations_mapping and key in self.csv_annotations_mapping:
+            annot_dialog.annotations.update(self.csv_annotations_mapping[key])
+        if annot_dialog.exec() == QDialog.DialogCode.Accepted:
+            annotations = annot_dialog.annotations
+            # The clip pass decodes/re-encodes video; hand it to the pool so
+            # the window keeps repainting, and finish up (temp AVI cleanup,
+            # queue advance) in _on_clip_finished.
+            if self.output_folder and self.output_folder_checkbox.isChecked():
+                dest_dir = Path(self.output_folder)
+            else:
+                dest_dir = self.output_file.parent
+            self._clip_runnable = _ClipRunnable(
+                self, annotations, self.temp_avi_file, dest_dir
+            )
+            self._clip_runnable.signals.finished_signal.connect(
+                self._on_clip_finished, Qt.ConnectionType.QueuedConnection
+            )
+            self.convert_button.setEnabled(False)
+            self.select_file_button.setEnabled(False)
+            QThreadPool.globalInstance().start(self._clip_runnable)
+            return
+        QMessageBox.warning(self, "Annotation", "Annotation cancelled.")
+        self._cleanup_temp_avi()
+        self.convert_button.setEnabled(True)
+        self.select_file_button.setEnabled(True)
+        self.current_file_index += 1
+        self.progress_bar.setValue(0)
+        self.process_next_file()
+
+    def _cleanup_temp_avi(self) -> None:
+        """Delete the scratch AVI left over from a ``.seq`` clip run.
+
+        ``unlink(missing_ok=True)`` removes it in one syscall without a prior
+        existence check; a locked file (e.g., something still holding it open
+        on Windows) is reported to the console rather than swallowed.
+        """
+        if self.current_extension != ".seq" or self.temp_avi_file is None:
+            return
+        # Release the cached handle first; an open capture would keep the
+        # file locked on Windows.
+        self._release_capture(self.temp_avi_file)
+        try:
+            Path(self.temp_avi_file).unlink(missing_ok=True)
+        except OSError as e:
+            self._append_console(f"Could not remove {self.temp_avi_file}: {e}")
+
+    @pyqtSlot(bool, str)
+    def _on_clip_finished(self, success: bool, message: str) -> None:
+        """Surface the clip result, drop the temp AVI, and advance the queue."""
+        self._clip_runnable = None
+        if success:
+            QMessageBox.information(self, "Success", message)
+        else:
+            QMessageBox.critical(self, "Error", message)
+        self._cleanup_temp_avi()
+        self.convert_button.setEnabled(True)
+        self.select_file_button.setEnabled(True)
+        self.current_file_index += 1
+        self.progress_bar.setValue(0)
+        self.process_next_file()
+
     @pyqtSlot(bool, str)
     def on_conversion_finished(self, success: bool, message: str) -> None:
         """Handle completion of a conversion.
@@ -717,22 +1416,60 @@ class MainWindow(QMainWindow):
         self.progress_bar.setValue(0)
         self.process_next_file()
 
+    def _open_capture(self, cv2, path: Path):
+        """Return an open ``cv2.VideoCapture`` for ``path``, cached with LRU.
+
+        Re-inserting on every hit keeps the dict ordered oldest-first; the
+        eviction loop releases handles beyond the four most recent.
+        """
+        key = str(path)
+        cap = self._cap_cache.pop(key, None)
+        if cap is None or not cap.isOpened():
+            cap = cv2.VideoCapture(key)
+        self._cap_cache[key] = cap
+        while len(self._cap_cache) > 4:
+            old_key = next(iter(self._cap_cache))
+            self._cap_cache.pop(old_key).release()
+        return cap
+
+    def _release_capture(self, path) -> None:
+        """Drop and release the cached capture for ``path``, if any."""
+        cap = self._cap_cache.pop(str(path), None)
+        if cap is not None:
+            cap.release()
+
+    def closeEvent(self, event) -> None:
+        """Release any cached video handles on shutdown."""
+        for cap in self._cap_cache.values():
+            cap.release()
+        self._cap_cache.clear()
+        super().closeEvent(event)
+
     def clip_by_annotations(
-        self, annotations: Dict[str, Dict[str, int]], video_path: Path
+        self,
+        annotations: Dict[str, Dict[str, int]],
+        video_path: Path,
+        dest_dir: Path,
     ) -> Tuple[bool, str]:
         """Write one output clip per intruder interval.
 
-        Validates intervals (both enter/exit set, exit ≥ enter, no overlaps), opens
-        the source video, and writes a clip per intruder using a format-specific codec.
+        Validates intervals (both enter/exit set, exit ≥ enter, no overlaps), then
+        cuts each intruder's span with an FFmpeg ``-ss``/``-t`` stream copy where
+        possible, falling back to an OpenCV decode/re-encode loop per clip.
+        Runs on a pool thread (see :class:`_ClipRunnable`), so it must not
+        touch widgets; the caller resolves ``dest_dir`` up front.
 
         Args:
             annotations: Mapping of intruder name → ``{"enter": int, "exit": int}``.
             video_path: Path to the frame-accurate source (the temp AVI or original AVI).
+            dest_dir: Directory the clips are written into.
 
         Returns:
             Tuple[bool, str]: ``(success, message)`` summarizing the result.
 
         """
+        # Insert sorted and check only the two neighbours: overlaps fail on
+        # the first offending interval instead of after a full sort + sweep.
         intervals = []
         for intruder, data in annotations.items():
             if "enter" not in data or "exit" not in data:
@@ -744,19 +1481,28 @@ class MainWindow(QMainWindow):
                     False,
                     f"Exit frame occurs before enter frame for intruder '{intruder}'.",
                 )
-            intervals.append((enter_frame, exit_frame, intruder))
-
-        intervals.sort(key=lambda x: x[0])
-        for i in range(len(intervals) - 1):
-            if intervals[i + 1][0] <= intervals[i][1]:
+            interval = (enter_frame, exit_frame, intruder)
+            idx = bisect.bisect_left(intervals, interval)
+            if idx and enter_frame <= intervals[idx - 1][1]:
+                return False, (
+                    "Overlapping intruder intervals found between "
+                    f"'{intervals[idx - 1][2]}' and '{intruder}'."
+                )
+            if idx < len(intervals) and intervals[idx][0] <= exit_frame:
                 return False, (
                     "Overlapping intruder intervals found between "
-                    f"'{intervals[i][2]}' and '{intervals[i + 1][2]}'."
+                    f"'{intruder}' and '{intervals[idx][2]}'."
                 )
+            intervals.insert(idx, interval)
+
+        if not intervals:
+            # Accepting the dialog with no annotations is a no-op, not an
+            # error; an empty job list would also blow up the cut executor.
+            return True, f"No annotations to clip for file {self.input_file.name}."
 
         import cv2
 
-        cap = cv2.VideoCapture(str(video_path))
+        cap = self._open_capture(cv2, video_path)
         if not cap.isOpened():
             return False, f"Could not open {video_path} for clipping."
         fps = cap.get(cv2.CAP_PROP_FPS)
@@ -765,29 +1511,115 @@ class MainWindow(QMainWindow):
         width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         ext = self.output_file.suffix.lower()
-        codec_map = {".mp4": "mp4v", ".avi": "MJPG", ".mov": "mp4v", ".mkv": "mp4v"}
-        codec_str = codec_map.get(ext, "mp4v")
-        fourcc = cv2.VideoWriter_fourcc(*codec_str)
-        for enter_frame, exit_frame, intruder in intervals:
-            output_name = (
-                f"{self.output_file.stem}_{intruder}intruder{self.output_file.suffix}"
+        # Attempt packet-level cuts first; whatever remains is re-encoded in
+        # one sequential pass over the file instead of re-seeking per clip.
+        stem = self.output_file.stem
+        suffix = self.output_file.suffix
+        jobs = [
+            (enter_frame, exit_frame, dest_dir / f"{stem}_{intruder}intruder{suffix}")
+            for enter_frame, exit_frame, intruder in intervals
+        ]
+        # Each cut is an independent ffmpeg child process, so run them
+        # concurrently — Python only supervises. Clips the cut could not
+        # handle fall through to the re-encode pass, still in frame order.
+        # Packet copies are only safe on the all-keyframe MJPEG intermediate;
+        # a source clipped in place (.mp4/.avi) may be long-GOP, where a copy
+        # cut would snap to the nearest keyframe instead of the exact frame.
+        allow_copy = Path(video_path) != Path(self.input_file)
+        with ThreadPoolExecutor(
+            max_workers=min(len(jobs), os.cpu_count() or 1)
+        ) as pool:
+            cut_ok = list(
+                pool.map(
+                    lambda job: _clip_with_ffmpeg(
+                        video_path, job[2], job[0], job[1], fps, allow_copy
+                    ),
+                    jobs,
+                )
             )
-            if self.output_folder and self.output_folder_checkbox.isChecked():
-                out_path = Path(self.output_folder) / output_name
-            else:
-                out_path = self.output_file.parent / output_name
-            out_writer = cv2.VideoWriter(str(out_path), fourcc, fps, (width, height))
-            cap.set(cv2.CAP_PROP_POS_FRAMES, enter_frame - 1)
-            while True:
-                current_idx = cap.get(cv2.CAP_PROP_POS_FRAMES)
-                if current_idx >= exit_frame:
-                    break
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                out_writer.write(frame)
-            out_writer.release()
-        cap.release()
+        fallback = [job for job, ok in zip(jobs, cut_ok) if not ok]
+        if fallback:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, fallback[0][0] - 1)
+            # grab()/retrieve() split: frames between clips are demuxed but
+            # never decoded, and gaps beyond ~2 s are skipped with a seek.
+            # Intervals never overlap (checked above), so at most one writer
+            # is live at a time and each opens right when its clip starts.
+            import numpy as np
+
+            # Decode and encode overlap: this thread demuxes/decodes into a
+            # small ring of preallocated buffers while a worker drains the
+            # bounded queue and encodes.  Both cap.retrieve and writer.write
+            # release the GIL inside OpenCV/ffmpeg, so the stages genuinely
+            # run in parallel.  A (writer, None) item orders the release
+            # after that clip's final frame is encoded.
+            frames: queue.Queue = queue.Queue(maxsize=8)
+            free: queue.Queue = queue.Queue()
+            for _ in range(4):
+                free.put(np.empty((height, width, 3), dtype=np.uint8))
+
+            # Any writer call can fail — a staged move to a full destination,
+            # a dead ffmpeg pipe, a PyAV encode error. Collect the errors and
+            # keep draining: if the consumer died mid-queue the producer would
+            # block forever on free.get() and the pass would never finish.
+            encode_errors = []
+
+            def _encode() -> None:
+                bad = set()  # writers that already failed; skip their frames
+                while True:
+                    item = frames.get()
+                    if item is None:
+                        break
+                    writer, buf = item
+                    try:
+                        if id(writer) not in bad:
+                            if buf is None:
+                                writer.release()
+                            else:
+                                writer.write(buf)
+                    except Exception as e:
+                        bad.add(id(writer))
+                        encode_errors.append(str(e))
+                    finally:
+                        if buf is not None:
+                            free.put(buf)
+
+            encoder = threading.Thread(target=_encode, daemon=True)
+            encoder.start()
+            frame_no = fallback[0][0]
+            idx = 0
+            out_writer = None
+            try:
+                while idx < len(fallback):
+                    enter_frame, exit_frame, out_path = fallback[idx]
+                    if out_writer is None and frame_no < enter_frame - fps * 2:
+                        cap.set(cv2.CAP_PROP_POS_FRAMES, enter_frame - 1)
+                        frame_no = enter_frame
+                    if not cap.grab():
+                        break
+                    if frame_no >= enter_frame:
+                        if out_writer is None:
+                            out_writer = _open_clip_writer(
+                                cv2, out_path, ext, fps, (width, height)
+                            )
+                        buf = free.get()
+                        ret, frame = cap.retrieve(buf)
+                        if not ret:
+                            free.put(buf)
+                            break
+                        frames.put((out_writer, frame))
+                        if frame_no == exit_frame:
+                            frames.put((out_writer, None))
+                            out_writer = None
+                            idx += 1
+                    frame_no += 1
+            finally:
+                if out_writer is not None:
+                    frames.put((out_writer, None))
+                frames.put(None)
+                encoder.join()
+            if encode_errors:
+                return False, "Failed to finalize clips: " + "; ".join(encode_errors)
+        # Handle stays open in _cap_cache for the next run on this source.
         return True, f"Successfully clipped intruders for file {self.input_file.name}."
 
     def launch_sleap(self) -> None:
@@ -77,11 +77,11 @@ def test_perform_single_click_seeks_by_frame(qapp):
             self.last = ms
 
     dlg.mediaPlayer = StubPlayer()
-    dlg.fps = 25  # 25 fps -> 40ms/frame
+    dlg._set_fps(25.0)  # 25 fps -> 40ms/frame
     dlg.total_frames = 100
     # Put frame "11" in Alice's Enter cell and single-click it
     dlg.annotationTable.item(0, 1).setText("11")
     dlg.clicked_row = 0
     dlg.clicked_column = 1
     VideoAnnotationDialog.perform_single_click(dlg)
-    assert dlg.mediaPlayer.last == int((11 - 1) * (1000 / 25))
+    assert dlg.mediaPlayer.last == (11 - 1) * 1000 // 25
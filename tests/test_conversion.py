@@ -155,7 +155,31 @@ def test_image_to_image_roundtrip(tmp_path):
 
 
 def test_pdf_to_image_uses_convert_from_path(monkeypatch, tmp_path):
-    """Mock pdf2image to ensure multiple pages are saved with suffixes."""
+    """Mock pdf2image to ensure poppler-written pages are renamed with suffixes."""
+    from mouse_trap import conversion as conv
+
+    def fake_convert_from_path(_, **kwargs):
+        assert kwargs["paths_only"]
+        pages = [tmp_path / "export_page-1.png", tmp_path / "export_page-2.png"]
+        for p in pages:
+            p.write_bytes(b"PNG")
+        return [str(p) for p in pages]
+
+    monkeypatch.setattr(conv, "convert_from_path", fake_convert_from_path)
+
+    t = conv.ConversionThread(
+        input_file=tmp_path / "doc.pdf",
+        output_file=tmp_path / "export.png",
+        conversion_type="pdf_to_image",
+    )
+    ok, msg = t.pdf_to_image()
+    assert ok, msg
+    assert (tmp_path / "export_page0.png").exists()
+    assert (tmp_path / "export_page1.png").exists()
+
+
+def test_pdf_to_image_falls_back_to_pillow_for_bmp(monkeypatch, tmp_path):
+    """Formats poppler can't emit natively still go through the PIL path."""
     from mouse_trap import conversion as conv
 
     saved = []
@@ -176,13 +200,13 @@ def test_pdf_to_image_uses_convert_from_path(monkeypatch, tmp_path):
 
     t = conv.ConversionThread(
         input_file=tmp_path / "doc.pdf",
-        output_file=tmp_path / "export.png",
+        output_file=tmp_path / "export.bmp",
         conversion_type="pdf_to_image",
     )
     ok, msg = t.pdf_to_image()
     assert ok, msg
-    assert any(p.name.endswith("_page0.png") for p in saved)
-    assert any(p.name.endswith("_page1.png") for p in saved)
+    assert any(p.name.endswith("_page0.bmp") for p in saved)
+    assert any(p.name.endswith("_page1.bmp") for p in saved)
 
 
 def test_pandoc_and_docx2pdf_paths(monkeypatch, tmp_path):
@@ -12,7 +12,7 @@ def test_update_output_options_respects_mapping(qapp):
     w.current_extension = ".pdf"
     w.update_output_options()
     items = [w.output_combo.itemText(i) for i in range(w.output_combo.count())]
-    assert items == w.OUTPUT_FORMATS[".pdf"]
+    assert items == list(w.OUTPUT_FORMATS[".pdf"])
 
 
 @pytest.mark.parametrize(
@@ -44,16 +44,19 @@ def test_clip_by_annotations_validation_errors(qapp, tmp_path):
     w.output_file = tmp_path / "result.mp4"
 
     # Missing exit
-    ok, msg = w.clip_by_annotations({"A": {"enter": 10}}, Path("dummy.avi"))
+    ok, msg = w.clip_by_annotations({"A": {"enter": 10}}, Path("dummy.avi"), tmp_path)
     assert not ok and "Incomplete annotation" in msg
 
     # Exit before enter
-    ok, msg = w.clip_by_annotations({"A": {"enter": 10, "exit": 5}}, Path("dummy.avi"))
+    ok, msg = w.clip_by_annotations(
+        {"A": {"enter": 10, "exit": 5}}, Path("dummy.avi"), tmp_path
+    )
     assert not ok and "Exit frame occurs before enter frame" in msg
 
     # Overlapping intervals
     ok, msg = w.clip_by_annotations(
         {"A": {"enter": 10, "exit": 50}, "B": {"enter": 40, "exit": 60}},
         Path("dummy.avi"),
+        tmp_path,
     )
     assert not ok and "Overlapping intruder intervals" in msg